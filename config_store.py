@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Linux Gaming Center - Config Store Module
+Keeps one parsed copy of each settings file so panels sharing a file share its settings
+"""
+
+import os
+
+from json_helper import read_json, write_json
+
+
+# Parsed settings keyed by file path, as [mtime_ns, dict]
+_configs = {}
+
+
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_config(path):
+    """Get the settings dict for a JSON file, parsing it only when it changed
+
+    Every caller gets the same dict, so changes made by one panel are seen by
+    the others. If the file is changed on disk the dict is refilled in place.
+    A missing or unreadable file gives an empty dict.
+    """
+    path = str(path)
+    mtime = _get_mtime(path)
+    cached = _configs.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    data = {}
+    if mtime is not None:
+        try:
+            data = read_json(path)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {path}: {e}")
+        if not isinstance(data, dict):
+            data = {}
+
+    if cached is None:
+        cached = _configs[path] = [mtime, data]
+    else:
+        cached[0] = mtime
+        cached[1].clear()
+        cached[1].update(data)
+    return cached[1]
+
+
+def save_config(path):
+    """Write the cached settings for path back to the file
+
+    Raises OSError if the file can't be written.
+    """
+    path = str(path)
+    cached = _configs.get(path)
+    if cached is None:
+        return
+    write_json(path, cached[1])
+    cached[0] = _get_mtime(path)
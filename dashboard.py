@@ -9,13 +9,8 @@ from pathlib import Path
 import json
 import os
 from path_helper import get_user_account_dir, get_config_file_path, get_data_base_path
-
-# Try to import PIL for image handling (optional)
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from image_cache import PIL_AVAILABLE, get_photo
+from json_helper import write_json
 
 
 class DashboardScreen:
@@ -74,12 +69,18 @@ class DashboardScreen:
         
         # Configure scroll region
         def configure_scroll_region(event=None):
-            self.scroll_canvas.update_idletasks()
-            # Always set canvas window to full canvas size
-            canvas_width = event.width if event else self.scroll_canvas.winfo_width()
-            canvas_height = event.height if event else self.scroll_canvas.winfo_height()
-            if canvas_width > 1 and canvas_height > 1:
-                self.scroll_canvas.itemconfig(self.scroll_canvas_window, width=canvas_width, height=canvas_height)
+            # This is bound to both the canvas and the content area - only the canvas's own
+            # Configure carries the size the window should fill. The content area's Configure
+            # just means its contents changed, so only the scroll region needs updating.
+            if event is not None and event.widget is self.scroll_canvas:
+                canvas_width = event.width
+                canvas_height = event.height
+                # Always set canvas window to full canvas size
+                if canvas_width > 1 and canvas_height > 1:
+                    self.scroll_canvas.itemconfig(self.scroll_canvas_window, width=canvas_width, height=canvas_height)
+            else:
+                canvas_width = self.scroll_canvas.winfo_width()
+                canvas_height = self.scroll_canvas.winfo_height()
             
             # For scroll region, check if we have a frame that needs scrolling or should fill
             bbox = self.scroll_canvas.bbox("all")
@@ -190,11 +191,9 @@ class DashboardScreen:
         
         if home_image_path.exists() and PIL_AVAILABLE:
             try:
-                image = Image.open(home_image_path)
                 # Resize to fit menu bar (larger, scaled)
                 icon_size = self.scaler.scale_dimension(40)
-                image = image.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(image)
+                photo = get_photo(home_image_path, icon_size, icon_size)
                 
                 self.home_button = tk.Button(
                     self.menu_bar_frame,
@@ -272,11 +271,9 @@ class DashboardScreen:
         profile_image_label = None
         if self.profile_image_path and os.path.exists(self.profile_image_path) and PIL_AVAILABLE:
             try:
-                image = Image.open(self.profile_image_path)
                 # Resize to larger size for menu bar (scaled)
                 profile_icon_size = self.scaler.scale_dimension(40)
-                image = image.resize((profile_icon_size, profile_icon_size), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(image)
+                photo = get_photo(self.profile_image_path, profile_icon_size, profile_icon_size)
                 
                 profile_image_label = tk.Label(
                     self.profile_container,
@@ -344,9 +341,7 @@ class DashboardScreen:
         
         if store_icon_path.exists() and PIL_AVAILABLE:
             try:
-                image = Image.open(store_icon_path)
-                image = image.resize((store_icon_size, store_icon_size), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(image)
+                photo = get_photo(store_icon_path, store_icon_size, store_icon_size)
                 
                 store_icon_label = tk.Label(
                     self.store_button,
@@ -594,11 +589,9 @@ class DashboardScreen:
         # Power button
         if power_image_path.exists() and PIL_AVAILABLE:
             try:
-                image = Image.open(power_image_path)
                 # Resize to fit menu bar (larger, scaled)
                 icon_size = self.scaler.scale_dimension(40)
-                image = image.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(image)
+                photo = get_photo(power_image_path, icon_size, icon_size)
                 
                 self.power_button = tk.Button(
                     self.right_container,
@@ -731,10 +724,8 @@ class DashboardScreen:
             button = None
             if image_path.exists() and PIL_AVAILABLE:
                 try:
-                    image = Image.open(image_path)
                     # Resize to larger size (250x200 - wider)
-                    image = image.resize((350, 200), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
+                    photo = get_photo(image_path, 350, 200)
                     
                     button = tk.Button(
                         button_frame,
@@ -1059,9 +1050,7 @@ class DashboardScreen:
             button = None
             if image_path.exists() and PIL_AVAILABLE:
                 try:
-                    image = Image.open(image_path)
-                    image = image.resize((button_width, button_height), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
+                    photo = get_photo(image_path, button_width, button_height)
                     
                     button = tk.Button(
                         button_frame,
@@ -1109,7 +1098,6 @@ class DashboardScreen:
                 button.pack()
         
         # Update canvas scroll region after loading games
-        self.recently_used_osg_frame.update_idletasks()
         self.recently_used_osg_canvas.update_idletasks()
         bbox = self.recently_used_osg_canvas.bbox("all")
         if bbox:
@@ -1341,9 +1329,7 @@ class DashboardScreen:
             button = None
             if image_path.exists() and PIL_AVAILABLE:
                 try:
-                    image = Image.open(image_path)
-                    image = image.resize((button_width, button_height), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
+                    photo = get_photo(image_path, button_width, button_height)
                     
                     button = tk.Button(
                         button_frame,
@@ -1391,7 +1377,6 @@ class DashboardScreen:
                 button.pack()
         
         # Update canvas scroll region after loading games
-        self.recently_used_ws_frame.update_idletasks()
         self.recently_used_ws_canvas.update_idletasks()
         bbox = self.recently_used_ws_canvas.bbox("all")
         if bbox:
@@ -1527,9 +1512,7 @@ class DashboardScreen:
             button = None
             if image_path.exists() and PIL_AVAILABLE:
                 try:
-                    image = Image.open(image_path)
-                    image = image.resize((button_width, button_height), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
+                    photo = get_photo(image_path, button_width, button_height)
                     
                     button = tk.Button(
                         button_frame,
@@ -1577,7 +1560,6 @@ class DashboardScreen:
                 button.pack()
         
         # Update canvas scroll region after loading apps
-        self.recently_used_frame.update_idletasks()
         self.recently_used_canvas.update_idletasks()
         bbox = self.recently_used_canvas.bbox("all")
         if bbox:
@@ -1915,8 +1897,7 @@ class DashboardScreen:
                             self.profile_image_path = str(potential_path)
                             # Update the account data with the correct path
                             account_data['profile_image'] = str(potential_path)
-                            with open(account_file, 'w') as f:
-                                json.dump(account_data, f, indent=2)
+                            write_json(account_file, account_data)
                             break
             except Exception as e:
                 print(f"Error loading account data: {e}")
@@ -2004,10 +1985,3 @@ class DashboardScreen:
                 root.unbind("<KeyPress>")
             except:
                 pass
-        # Unbind keyboard events from root window
-        root = self.parent.winfo_toplevel()
-        if hasattr(self, 'on_arrow_key'):
-            try:
-                root.unbind("<KeyPress>", self.on_arrow_key)
-            except:
-                pass
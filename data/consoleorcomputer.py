@@ -5,24 +5,23 @@ Template for individual emulator library views
 """
 
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+from tkinter import messagebox
 from pathlib import Path
-import json
 import os
-import subprocess
+import queue
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import threading
+_ROOT = str(Path(__file__).parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 from path_helper import get_roms_path, get_bios_path
 
-# Try to import PIL for image handling
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-
 
 class ConsoleLibraryFrame:
+    # Number of ROMs the scan posts at a time - each batch is added to the grid in
+    # its own callback, so large folders fill in progressively instead of all at once
+    ROM_BATCH_SIZE = 48
+    
     def __init__(self, parent, theme, scaler, username=None, console_name=None, short_name=None, roms_dir=None, bios_dir=None, back_callback=None):
         self.parent = parent
         self.theme = theme
@@ -92,31 +91,80 @@ class ConsoleLibraryFrame:
         
         self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         
-        def configure_scroll_region(event=None):
-            self.canvas.update_idletasks()
+        # Theme colors used by the grid, looked up once rather than on every reload
+        self._colors = {
+            "background": bg_color,
+            "text_primary": text_color,
+            "text_secondary": self.theme.get_color("text_secondary", "#E0E0E0"),
+            "menu_bar": self.theme.get_color("menu_bar", "#2D2D2D"),
+        }
+        
+        # Grid configuration - fixed for the lifetime of the frame, so worked out once
+        self.items_per_row = 4
+        self.button_width = self.scaler.scale_dimension(350)
+        self.button_height = self.scaler.scale_dimension(200)
+        self.button_padding = self.scaler.scale_padding(15)
+        # Text buttons are sized in characters rather than pixels
+        self.text_button_width = self.scaler.scale_dimension(20)
+        self.text_button_height = self.scaler.scale_dimension(10)
+        self.label_padding = self.scaler.scale_padding(5)
+        
+        # Configure grid columns
+        for col in range(self.items_per_row):
+            self.scrollable_frame.grid_columnconfigure(col, weight=0, minsize=self.button_width + (self.button_padding * 2))
+        
+        # Pending after() id for the coalesced scroll region update
+        self._scroll_region_after_id = None
+        # Width last applied to the canvas window, so unchanged widths skip the itemconfig
+        self._window_width = None
+        # Queue the running ROM scan posts its results to, None when no scan is running
+        self._scan_queue = None
+        # Number of ROMs the running scan has displayed so far
+        self._scan_shown = 0
+        # Set when a rescan is requested while a scan is running
+        self._rescan_pending = False
+        # Grid cells (button_frame, button, name_label) kept across scans and reused
+        self._rom_cells = []
+        self._empty_label = None
+        
+        def set_window_width(width):
+            if width != self._window_width:
+                self._window_width = width
+                self.canvas.itemconfig(self.canvas_window, width=width)
+        
+        def update_scroll_region():
+            self._scroll_region_after_id = None
             bbox = self.canvas.bbox("all")
             if bbox:
                 self.canvas.configure(scrollregion=(0, 0, bbox[2], bbox[3] + 50))
-            if event:
-                canvas_width = event.width
-                if canvas_width > 0:
-                    self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-            else:
-                self.canvas.update_idletasks()
-                canvas_width = self.canvas.winfo_width()
-                if canvas_width > 1:
-                    self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+            canvas_width = self.canvas.winfo_width()
+            if canvas_width > 1:
+                set_window_width(canvas_width)
+        
+        def configure_scroll_region(event=None):
+            # Resizing fires a burst of Configure events - only update once they settle
+            if self._scroll_region_after_id:
+                self.canvas.after_cancel(self._scroll_region_after_id)
+            self._scroll_region_after_id = self.canvas.after(120, update_scroll_region)
         
         self.scrollable_frame.bind("<Configure>", configure_scroll_region)
         
         def configure_canvas(event):
             canvas_width = event.width
             if canvas_width > 0:
-                self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+                set_window_width(canvas_width)
             configure_scroll_region()
         
         self.canvas.bind("<Configure>", configure_canvas)
         
+        def cancel_scroll_region_update(event):
+            # Destroying the canvas deletes the timer's callback, so drop the timer too
+            if event.widget is self.canvas and self._scroll_region_after_id:
+                self.canvas.after_cancel(self._scroll_region_after_id)
+                self._scroll_region_after_id = None
+        
+        self.canvas.bind("<Destroy>", cancel_scroll_region_update, add="+")
+        
         self.canvas.pack(fill=tk.BOTH, expand=True)
         
         # Mousewheel scrolling
@@ -136,8 +184,7 @@ class ConsoleLibraryFrame:
         self.scrollable_frame.bind("<Button-4>", scroll_up)
         self.scrollable_frame.bind("<Button-5>", scroll_down)
         
-        # Load ROMs
-        self.load_roms()
+        # ROMs are loaded by show(), which callers invoke right after construction
     
     def _on_mousewheel(self, event):
         """Handle mousewheel scrolling"""
@@ -151,98 +198,86 @@ class ConsoleLibraryFrame:
                     self.canvas.yview_scroll(scroll_amount, "units")
     
     def load_roms(self):
-        """Load and display all files and directories in the ROMs folder"""
-        # Clear existing widgets
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        # Ensure ROMs directory exists
-        self.roms_dir.mkdir(parents=True, exist_ok=True)
+        """Scan the ROMs folder on a worker thread, then display its contents"""
+        # A scan is already running - it may have listed the folder before the change
+        # that asked for this one, so scan once more when it finishes
+        if self._scan_queue is not None:
+            self._rescan_pending = True
+            return
         
-        # Get all files and directories in the ROMs folder
+        self._scan_queue = queue.Queue()
+        self._scan_shown = 0
+        threading.Thread(target=self.scan_roms, args=(self._scan_queue,), daemon=True).start()
+        self.frame.after(50, self.poll_scan)
+    
+    def scan_roms(self, results):
+        """List all files and directories in the ROMs folder (runs on a worker thread)"""
         rom_items = []
         try:
-            for item in self.roms_dir.iterdir():
-                rom_items.append(item)
+            # Ensure ROMs directory exists
+            self.roms_dir.mkdir(parents=True, exist_ok=True)
+            
+            # scandir gives the file type with the directory listing, so sorting
+            # and labelling don't need a stat call per item
+            with os.scandir(self.roms_dir) as entries:
+                for entry in entries:
+                    rom_items.append((Path(entry.path), entry.is_dir()))
         except Exception as e:
             print(f"Error reading ROMs directory: {e}")
         
         # Sort items: directories first, then files, both alphabetically
-        rom_items.sort(key=lambda x: (x.is_file(), x.name.lower()))
+        rom_items.sort(key=lambda x: (not x[1], x[0].name.lower()))
         
-        if not rom_items:
-            # Show empty state
-            bg_color = self.theme.get_color("background", "#000000")
-            text_secondary = self.theme.get_color("text_secondary", "#E0E0E0")
-            
-            empty_label = tk.Label(
-                self.scrollable_frame,
-                text=f"No ROMs found in:\n{self.roms_dir}\n\nAdd ROM files to this directory to see them here.",
-                font=self.theme.get_font("body", scaler=self.scaler),
-                bg=bg_color,
-                fg=text_secondary,
-                justify=tk.CENTER
-            )
-            empty_label.pack(pady=self.scaler.scale_padding(50))
+        # Post the results in batches, then None to mark the end of the scan
+        for start in range(0, len(rom_items), self.ROM_BATCH_SIZE):
+            results.put(rom_items[start:start + self.ROM_BATCH_SIZE])
+        results.put(None)
+    
+    def poll_scan(self):
+        """Add the next batch of scan results to the grid, one batch per callback"""
+        if not self.frame.winfo_exists():
             return
         
-        # Display ROMs in grid
-        bg_color = self.theme.get_color("background", "#000000")
-        text_color = self.theme.get_color("text_primary", "#FFFFFF")
-        menu_bar_color = self.theme.get_color("menu_bar", "#2D2D2D")
+        try:
+            rom_items = self._scan_queue.get_nowait()
+        except queue.Empty:
+            self.frame.after(50, self.poll_scan)
+            return
         
-        # Grid configuration
-        items_per_row = 4
-        button_width = self.scaler.scale_dimension(350)
-        button_height = self.scaler.scale_dimension(200)
-        button_padding = self.scaler.scale_padding(15)
+        if rom_items is None:
+            self._scan_queue = None
+            self.finish_roms(self._scan_shown)
+            if self._rescan_pending:
+                self._rescan_pending = False
+                self.load_roms()
+            return
         
-        # Configure grid columns
-        for col in range(items_per_row):
-            self.scrollable_frame.grid_columnconfigure(col, weight=0, minsize=button_width + (button_padding * 2))
+        self.display_roms(rom_items, self._scan_shown)
+        self._scan_shown += len(rom_items)
         
-        for i, rom_item in enumerate(rom_items):
-            row = i // items_per_row
-            col = i % items_per_row
-            
-            # Create button frame
-            button_frame = tk.Frame(self.scrollable_frame, bg=bg_color)
-            button_frame.grid(row=row, column=col, padx=button_padding, pady=button_padding)
-            
-            # Get display name
-            if rom_item.is_dir():
-                item_name = f"[DIR] {rom_item.name}"
-            else:
-                item_name = rom_item.name
-            
-            # Create button (placeholder - you can add ROM cover images later)
-            button = tk.Button(
-                button_frame,
-                text=item_name,
-                command=lambda ri=rom_item: self.run_rom(ri),
-                bg=menu_bar_color,
-                fg=text_color,
-                cursor="hand2",
-                relief=tk.FLAT,
-                width=self.scaler.scale_dimension(20),
-                height=self.scaler.scale_dimension(10),
-                font=self.theme.get_font("body_small", scaler=self.scaler)
-            )
-            button.pack()
-            
-            # Item name label below button
-            name_label = tk.Label(
-                button_frame,
-                text=item_name,
-                font=self.theme.get_font("body_small", scaler=self.scaler),
-                bg=bg_color,
-                fg=text_color,
-                wraplength=button_width
-            )
-            name_label.pack(pady=(self.scaler.scale_padding(5), 0))
+        # Let Tk redraw and handle input before the next batch
+        self.frame.after(1, self.poll_scan)
+    
+    def finish_roms(self, count):
+        """Tidy up the grid once all count ROMs of a scan have been displayed"""
+        # Hide cells left over from a longer previous listing
+        for button_frame, _, _ in self._rom_cells[count:]:
+            button_frame.grid_remove()
+        
+        if not count:
+            # Show empty state
+            if self._empty_label is None:
+                self._empty_label = tk.Label(
+                    self.scrollable_frame,
+                    text=f"No ROMs found in:\n{self.roms_dir}\n\nAdd ROM files to this directory to see them here.",
+                    font=self.theme.get_font("body", scaler=self.scaler),
+                    bg=self._colors["background"],
+                    fg=self._colors["text_secondary"],
+                    justify=tk.CENTER
+                )
+            self._empty_label.grid(row=0, column=0, columnspan=self.items_per_row, pady=self.scaler.scale_padding(50))
         
         # Update canvas scroll region
-        self.scrollable_frame.update_idletasks()
         self.canvas.update_idletasks()
         
         bbox = self.canvas.bbox("all")
@@ -252,8 +287,80 @@ class ConsoleLibraryFrame:
             canvas_width = self.canvas.winfo_width() or 800
             canvas_height = self.canvas.winfo_height() or 600
             self.canvas.configure(scrollregion=(0, 0, canvas_width, canvas_height))
+    
+    def display_roms(self, rom_items, start=0):
+        """Display scanned ROMs in the grid from position start, reusing cells from the previous scan"""
+        cells = self._rom_cells
+        
+        if start == 0:
+            # Hide the empty state from a previous scan and go back to the top
+            if self._empty_label is not None:
+                self._empty_label.grid_remove()
+            self.canvas.yview_moveto(0)
+        
+        # Display ROMs in grid
+        bg_color = self._colors["background"]
+        text_color = self._colors["text_primary"]
+        menu_bar_color = self._colors["menu_bar"]
+        item_font = self.theme.get_font("body_small", scaler=self.scaler)
+        
+        # Grid configuration
+        items_per_row = self.items_per_row
+        button_width = self.button_width
+        button_padding = self.button_padding
+        text_button_width = self.text_button_width
+        text_button_height = self.text_button_height
+        label_padding = self.label_padding
         
-        self.canvas.yview_moveto(0)
+        for i, (rom_item, is_dir) in enumerate(rom_items, start):
+            row, col = divmod(i, items_per_row)
+            
+            # Get display name
+            if is_dir:
+                item_name = f"[DIR] {rom_item.name}"
+            else:
+                item_name = rom_item.name
+            
+            if i < len(cells):
+                # Reuse the cell in this position, only its text changes
+                button_frame, button, name_label = cells[i]
+                button.configure(text=item_name)
+                name_label.configure(text=item_name)
+            else:
+                # Create button frame
+                button_frame = tk.Frame(self.scrollable_frame, bg=bg_color)
+                
+                # Create button (placeholder - you can add ROM cover images later)
+                button = tk.Button(
+                    button_frame,
+                    text=item_name,
+                    bg=menu_bar_color,
+                    fg=text_color,
+                    cursor="hand2",
+                    relief=tk.FLAT,
+                    width=text_button_width,
+                    height=text_button_height,
+                    font=item_font
+                )
+                # The command reads the ROM from the button, so reused cells don't need a new one
+                button.configure(command=lambda b=button: self.run_rom(b.rom_item))
+                button.pack()
+                
+                # Item name label below button
+                name_label = tk.Label(
+                    button_frame,
+                    text=item_name,
+                    font=item_font,
+                    bg=bg_color,
+                    fg=text_color,
+                    wraplength=button_width
+                )
+                name_label.pack(pady=(label_padding, 0))
+                
+                cells.append((button_frame, button, name_label))
+            
+            button.rom_item = rom_item
+            button_frame.grid(row=row, column=col, padx=button_padding, pady=button_padding)
     
     def run_rom(self, rom_item):
         """Handle ROM file or directory click"""
@@ -5,26 +5,37 @@ App library similar to Jellyfin's movie library
 """
 
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk, Menu
+from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
 import json
+import logging
 import os
 import subprocess
 import shutil
 from datetime import datetime
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+_ROOT = str(Path(__file__).parent.parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+from ui_helper import ContextMenu, apply_combobox_style
+from image_cache import PIL_AVAILABLE, get_preview_photo, refine_images
 from path_helper import get_data_base_path, get_user_account_dir, get_config_file_path
 
-# Try to import PIL for image handling
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 class AppsFrame:
+    # Sort order choices, in the order they appear in the dropdown
+    SORT_OPTIONS = ("A to Z", "Z to A", "Newest added", "Oldest added")
+    
+    # Sort order -> (key, reverse). Apps without an added_date are treated as very old
+    SORT_KEYS = {
+        "A to Z": (lambda x: x.get("name", "").lower(), False),
+        "Z to A": (lambda x: x.get("name", "").lower(), True),
+        "Newest added": (lambda x: x.get("added_date", "1970-01-01"), True),
+        "Oldest added": (lambda x: x.get("added_date", "1970-01-01"), False),
+    }
+    
     def __init__(self, parent, theme, scaler, username=None):
         self.parent = parent
         self.theme = theme
@@ -110,17 +121,14 @@ class AppsFrame:
         
         # Sort options
         self.sort_var = tk.StringVar(value="A to Z")
-        sort_options = ["A to Z", "Z to A", "Newest added", "Oldest added"]
         
         # Create styled combobox
-        input_bg = self.theme.get_color("input_background", "#1A1A1A")
-        input_text = self.theme.get_color("input_text", "#FFFFFF")
         body_font = self.theme.get_font("body", scaler=self.scaler)
         
         sort_combobox = ttk.Combobox(
             top_bar,
             textvariable=self.sort_var,
-            values=sort_options,
+            values=self.SORT_OPTIONS,
             state="readonly",
             font=body_font,
             width=15
@@ -129,20 +137,7 @@ class AppsFrame:
         sort_combobox.bind("<<ComboboxSelected>>", lambda e: self.load_apps())
         
         # Style the combobox
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure('TCombobox',
-            fieldbackground=input_bg,
-            background=input_bg,
-            foreground=input_text,
-            borderwidth=1,
-            relief=tk.SOLID
-        )
-        style.map('TCombobox',
-            fieldbackground=[('readonly', input_bg)],
-            background=[('readonly', input_bg)],
-            foreground=[('readonly', input_text)]
-        )
+        apply_combobox_style(self.theme)
         
         # Scrollable canvas for app grid (no scrollbar)
         canvas_frame = tk.Frame(self.frame, bg=bg_color)
@@ -154,25 +149,55 @@ class AppsFrame:
         
         self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         
-        def configure_scroll_region(event=None):
+        # Right-click menu, created the first time it is needed
+        self._context_menu = None
+        
+        # Theme colors used by the grid, looked up once rather than on every reload
+        self._colors = {
+            "background": bg_color,
+            "text_primary": text_color,
+            "text_secondary": self.theme.get_color("text_secondary", "#E0E0E0"),
+            "menu_bar": self.theme.get_color("menu_bar", "#2D2D2D"),
+            "background_secondary": self.theme.get_color("background_secondary", "#1A1A1A"),
+        }
+        
+        # Grid configuration - fixed for the lifetime of the frame, so worked out once
+        self.items_per_row = 4
+        self.button_width = self.scaler.scale_dimension(350)  # Wider, more rectangular
+        self.button_height = self.scaler.scale_dimension(200)  # Keep height the same
+        self.button_padding = self.scaler.scale_padding(15)
+        
+        # Configure grid columns for proper layout
+        for col in range(self.items_per_row):
+            self.scrollable_frame.grid_columnconfigure(col, weight=0, minsize=self.button_width + (self.button_padding * 2))
+        
+        # Pending after() id for the coalesced scroll region update
+        self._scroll_region_after_id = None
+        # Width last applied to the canvas window, so unchanged widths skip the itemconfig
+        self._window_width = None
+        
+        def set_window_width(width):
+            if width != self._window_width:
+                self._window_width = width
+                self.canvas.itemconfig(self.canvas_window, width=width)
+        
+        def update_scroll_region():
+            self._scroll_region_after_id = None
             # Update the scroll region
-            self.canvas.update_idletasks()
             bbox = self.canvas.bbox("all")
             if bbox:
                 # Add padding to ensure we can scroll to the bottom
                 self.canvas.configure(scrollregion=(0, 0, bbox[2], bbox[3] + 50))
             # Set scrollable frame width to match canvas for proper grid layout
-            if event:
-                canvas_width = event.width
-                if canvas_width > 0:
-                    # Set width to match canvas so grid can use full width
-                    self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-            else:
-                # Initial setup - get canvas width
-                self.canvas.update_idletasks()
-                canvas_width = self.canvas.winfo_width()
-                if canvas_width > 1:  # Only if canvas has been rendered
-                    self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+            canvas_width = self.canvas.winfo_width()
+            if canvas_width > 1:  # Only if canvas has been rendered
+                set_window_width(canvas_width)
+        
+        def configure_scroll_region(event=None):
+            # Resizing fires a burst of Configure events - only update once they settle
+            if self._scroll_region_after_id:
+                self.canvas.after_cancel(self._scroll_region_after_id)
+            self._scroll_region_after_id = self.canvas.after(120, update_scroll_region)
         
         self.scrollable_frame.bind("<Configure>", configure_scroll_region)
         
@@ -180,12 +205,20 @@ class AppsFrame:
             # Update scrollable frame width to match canvas when canvas is resized
             canvas_width = event.width
             if canvas_width > 0:
-                self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+                set_window_width(canvas_width)
             # Update scroll region
             configure_scroll_region()
         
         self.canvas.bind("<Configure>", configure_canvas)
         
+        def cancel_scroll_region_update(event):
+            # Destroying the canvas deletes the timer's callback, so drop the timer too
+            if event.widget is self.canvas and self._scroll_region_after_id:
+                self.canvas.after_cancel(self._scroll_region_after_id)
+                self._scroll_region_after_id = None
+        
+        self.canvas.bind("<Destroy>", cancel_scroll_region_update, add="+")
+        
         # Configure grid columns - don't set weight, let content determine size
         # We'll configure columns dynamically when apps are loaded
         
@@ -216,8 +249,7 @@ class AppsFrame:
         # Current sort order
         self.current_sort = "A to Z"
         
-        # Load and display apps
-        self.load_apps()
+        # Apps are loaded by show(), which callers invoke right after construction
     
     def _on_mousewheel(self, event):
         """Handle mousewheel scrolling with improved sensitivity"""
@@ -516,19 +548,11 @@ class AppsFrame:
     
     def sort_apps(self, apps_list, sort_order):
         """Sort apps based on the selected sort order"""
-        if sort_order == "A to Z":
-            return sorted(apps_list, key=lambda x: x.get("name", "").lower())
-        elif sort_order == "Z to A":
-            return sorted(apps_list, key=lambda x: x.get("name", "").lower(), reverse=True)
-        elif sort_order == "Newest added":
-            # Sort by added_date descending (newest first)
-            # For apps without added_date, treat as very old
-            return sorted(apps_list, key=lambda x: x.get("added_date", "1970-01-01"), reverse=True)
-        elif sort_order == "Oldest added":
-            # Sort by added_date ascending (oldest first)
-            # For apps without added_date, treat as very old
-            return sorted(apps_list, key=lambda x: x.get("added_date", "1970-01-01"))
-        return apps_list
+        sort_key = self.SORT_KEYS.get(sort_order)
+        if sort_key is None:
+            return apps_list
+        key, reverse = sort_key
+        return sorted(apps_list, key=key, reverse=reverse)
     
     def load_apps(self):
         """Load and display all apps in a grid"""
@@ -545,9 +569,8 @@ class AppsFrame:
         
         if not apps:
             # Show empty state
-            bg_color = self.theme.get_color("background", "#000000")
-            text_color = self.theme.get_color("text_primary", "#FFFFFF")
-            text_secondary = self.theme.get_color("text_secondary", "#E0E0E0")
+            bg_color = self._colors["background"]
+            text_secondary = self._colors["text_secondary"]
             
             empty_label = tk.Label(
                 self.scrollable_frame,
@@ -561,23 +584,22 @@ class AppsFrame:
             return
         
         # Display apps in grid
-        bg_color = self.theme.get_color("background", "#000000")
-        text_color = self.theme.get_color("text_primary", "#FFFFFF")
-        menu_bar_color = self.theme.get_color("menu_bar", "#2D2D2D")
+        bg_color = self._colors["background"]
+        text_color = self._colors["text_primary"]
+        menu_bar_color = self._colors["menu_bar"]
+        active_bg = self._colors["background_secondary"]
+        item_font = self.theme.get_font("body_small", scaler=self.scaler)
         
         # Grid configuration
-        items_per_row = 4
-        button_width = self.scaler.scale_dimension(350)  # Wider, more rectangular
-        button_height = self.scaler.scale_dimension(200)  # Keep height the same
-        button_padding = self.scaler.scale_padding(15)
-        
-        # Configure grid columns for proper layout
-        for col in range(items_per_row):
-            self.scrollable_frame.grid_columnconfigure(col, weight=0, minsize=button_width + (button_padding * 2))
+        items_per_row = self.items_per_row
+        button_width = self.button_width
+        button_height = self.button_height
+        button_padding = self.button_padding
         
+        # Buttons showing a preview image that still need the full quality one
+        pending_refine = []
         for i, app in enumerate(apps):
-            row = i // items_per_row
-            col = i % items_per_row
+            row, col = divmod(i, items_per_row)
             
             # Create button frame
             button_frame = tk.Frame(self.scrollable_frame, bg=bg_color)
@@ -591,9 +613,8 @@ class AppsFrame:
             button = None
             if image_path.exists() and PIL_AVAILABLE:
                 try:
-                    image = Image.open(image_path)
-                    image = image.resize((button_width, button_height), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
+                    # Cheap preview first if the cover isn't cached yet, refined once the grid is up
+                    photo, is_final = get_preview_photo(image_path, button_width, button_height)
                     
                     button = tk.Button(
                         button_frame,
@@ -604,33 +625,17 @@ class AppsFrame:
                         relief=tk.FLAT,
                         borderwidth=0,
                         highlightthickness=0,
-                        activebackground=self.theme.get_color("background_secondary", "#1A1A1A")
+                        activebackground=active_bg
                     )
                     button.image = photo  # Keep reference
                     button.pack()
+                    if not is_final:
+                        pending_refine.append((button, image_path))
                     
                     # Add right-click context menu (prevent default button action on right-click)
-                    def on_right_click(event):
-                        # Stop event propagation
-                        event.widget.focus_set()
-                        # Capture event coordinates
-                        x_root = event.x_root
-                        y_root = event.y_root
-                        # Create a copy of app data to avoid closure issues
-                        app_data_copy = app.copy()
-                        # Create a simple event-like object with coordinates
-                        class MenuEvent:
-                            def __init__(self, x, y):
-                                self.x_root = x
-                                self.y_root = y
-                        menu_event = MenuEvent(x_root, y_root)
-                        # Show menu immediately - no delay needed
-                        self.show_app_context_menu(menu_event, app_data_copy)
-                        return "break"  # Prevent default button action
-                    
-                    button.bind("<Button-3>", on_right_click)
+                    button.bind("<Button-3>", lambda e, a=app: self.on_app_right_click(e, a))
                 except Exception as e:
-                    print(f"Error loading app image {image_path}: {e}")
+                    logger.warning("Error loading app image %s: %s", image_path, e)
                     # Fallback to text button
                     button = tk.Button(
                         button_frame,
@@ -642,29 +647,12 @@ class AppsFrame:
                         relief=tk.FLAT,
                         width=self.scaler.scale_dimension(20),
                         height=self.scaler.scale_dimension(10),
-                        font=self.theme.get_font("body_small", scaler=self.scaler)
+                        font=item_font
                     )
                     button.pack()
                     
                     # Add right-click context menu (prevent default button action on right-click)
-                    def on_right_click(event):
-                        # Stop event propagation
-                        event.widget.focus_set()
-                        # Capture event coordinates
-                        x_root = event.x_root
-                        y_root = event.y_root
-                        app_data_copy = app.copy()
-                        # Create a simple event-like object with coordinates
-                        class MenuEvent:
-                            def __init__(self, x, y):
-                                self.x_root = x
-                                self.y_root = y
-                        menu_event = MenuEvent(x_root, y_root)
-                        # Show menu immediately - no delay needed
-                        self.show_app_context_menu(menu_event, app_data_copy)
-                        return "break"
-                    
-                    button.bind("<Button-3>", on_right_click)
+                    button.bind("<Button-3>", lambda e, a=app: self.on_app_right_click(e, a))
             else:
                 # Fallback to text button
                 button = tk.Button(
@@ -677,24 +665,18 @@ class AppsFrame:
                     relief=tk.FLAT,
                     width=self.scaler.scale_dimension(20),
                     height=self.scaler.scale_dimension(10),
-                    font=self.theme.get_font("body_small", scaler=self.scaler)
+                    font=item_font
                 )
                 button.pack()
                 
                 # Add right-click context menu (prevent default button action on right-click)
-                def on_right_click(event):
-                    event.widget.focus_set()  # Set focus to prevent button click
-                    app_data_copy = app.copy()
-                    self.show_app_context_menu(event, app_data_copy)
-                    return "break"
-                
-                button.bind("<Button-3>", on_right_click)
+                button.bind("<Button-3>", lambda e, a=app: self.on_app_right_click(e, a))
             
             # App name label below button
             name_label = tk.Label(
                 button_frame,
                 text=app_name,
-                font=self.theme.get_font("body_small", scaler=self.scaler),
+                font=item_font,
                 bg=bg_color,
                 fg=text_color,
                 wraplength=button_width
@@ -703,7 +685,6 @@ class AppsFrame:
         
         # Update canvas scroll region after loading apps
         # Force update to ensure all widgets are rendered
-        self.scrollable_frame.update_idletasks()
         self.canvas.update_idletasks()
         
         # Get the bounding box of all items in the canvas
@@ -719,6 +700,11 @@ class AppsFrame:
         
         # Ensure we start at the top
         self.canvas.yview_moveto(0)
+        
+        # Replace preview images in the background. Started with a timer rather than
+        # after_idle, so update_idletasks calls can't run the whole refine pass at once
+        if pending_refine:
+            self.canvas.after(1, refine_images, self.canvas, pending_refine, button_width, button_height)
     
     def run_app(self, sh_file_path, app_name):
         """Run the app's .sh file and track it as recently used"""
@@ -796,115 +782,26 @@ class AppsFrame:
         except Exception as e:
             print(f"Error tracking recently used app: {e}")
     
+    def on_app_right_click(self, event, app_data):
+        """Show the context menu for a grid button without triggering its click action"""
+        event.widget.focus_set()
+        self.show_app_context_menu(event, app_data)
+        return "break"
+    
     def show_app_context_menu(self, event, app_data):
         """Show context menu for an app"""
         # Create a copy of app_data to avoid closure issues
         app_data_copy = app_data.copy()
         
-        menu = Menu(self.parent, tearoff=0)
-        menu.configure(
-            bg=self.theme.get_color("background_secondary", "#1A1A1A"),
-            fg=self.theme.get_color("text_primary", "#FFFFFF"),
-            activebackground=self.theme.get_color("primary", "#9D4EDD"),
-            activeforeground=self.theme.get_color("text_primary", "#FFFFFF"),
-            borderwidth=0,
-            font=self.theme.get_font("body_small", scaler=self.scaler)
-        )
-        
-        # Use separate functions to avoid immediate execution
-        def edit_app():
-            menu.destroy()
-            self.show_edit_app_popup(app_data_copy)
-        
-        def configure_commands():
-            menu.destroy()
-            self.open_sh_file_for_editing(app_data_copy)
-        
-        def delete_app():
-            menu.destroy()
-            self.delete_app(app_data_copy)
+        # One menu per frame, refilled for whichever item was right-clicked
+        if self._context_menu is None:
+            self._context_menu = ContextMenu(self.parent, self.theme, self.scaler)
         
-        menu.add_command(label="Edit app", command=edit_app)
-        menu.add_command(label="Configure commands", command=configure_commands)
-        menu.add_command(label="Delete app", command=delete_app)
-        
-        try:
-            # Show menu at cursor position with offset to prevent auto-selection
-            # Get current mouse position to ensure menu appears correctly
-            x = event.x_root
-            y = event.y_root
-            # Add offset to prevent menu from appearing directly under cursor
-            # which can cause the first item to be auto-selected when button is released
-            # Offset by several pixels to the right and down
-            
-            # Use update_idletasks to ensure everything is ready
-            self.parent.update_idletasks()
-            
-            # Show the menu using tk_popup
-            # This will keep the menu open until user selects an option or clicks outside
-            menu.tk_popup(x + 10, y + 10)
-            
-            # Add a small delay before allowing any close operations
-            # This prevents the menu from closing immediately after opening
-            menu_just_opened = {"value": True}
-            self.parent.after(100, lambda: menu_just_opened.update({"value": False}))
-            
-            # Add handler to close menu when clicking outside (only after initial delay)
-            def setup_close_handler():
-                root = self.parent.winfo_toplevel()
-                
-                def close_on_outside_click(event):
-                    # Don't close if menu was just opened
-                    if menu_just_opened.get("value", False):
-                        return
-                    
-                    try:
-                        if not menu.winfo_exists():
-                            return
-                        
-                        # Get menu bounds
-                        menu_x = menu.winfo_rootx()
-                        menu_y = menu.winfo_rooty()
-                        menu_w = menu.winfo_width()
-                        menu_h = menu.winfo_height()
-                        
-                        # Get click position
-                        click_x = event.x_root
-                        click_y = event.y_root
-                        
-                        # Check if click is outside menu (only for left clicks)
-                        if event.num == 1:  # Left click only
-                            if (click_x < menu_x or click_x > menu_x + menu_w or
-                                click_y < menu_y or click_y > menu_y + menu_h):
-                                menu.destroy()
-                                try:
-                                    root.unbind("<Button-1>")
-                                except:
-                                    pass
-                    except:
-                        pass
-                
-                # Only bind left click, not right click
-                root.bind("<Button-1>", close_on_outside_click, add="+")
-                
-                # Cleanup when menu is destroyed
-                def cleanup():
-                    try:
-                        root.unbind("<Button-1>")
-                    except:
-                        pass
-                
-                menu.bind("<Unmap>", lambda e: cleanup())
-            
-            # Setup close handler after menu is displayed
-            self.parent.after(150, setup_close_handler)
-            
-        except Exception as e:
-            print(f"Error showing context menu: {e}")
-            try:
-                menu.destroy()
-            except:
-                pass
+        self._context_menu.show(event, [
+            ("Edit app", lambda: self.show_edit_app_popup(app_data_copy)),
+            ("Configure commands", lambda: self.open_sh_file_for_editing(app_data_copy)),
+            ("Delete app", lambda: self.delete_app(app_data_copy)),
+        ])
     
     def show_edit_app_popup(self, app_data):
         """Show popup to edit an app"""
@@ -1062,10 +959,13 @@ class AppsFrame:
                 
                 # Find and update the app - compare with the relative path
                 app_found = False
+                changed = False
                 for app in apps_list:
                     if app.get("sh_file") == original_sh_file_relative:
-                        # Update app name
-                        app["name"] = app_name
+                        # Update app name if changed
+                        if app.get("name") != app_name:
+                            app["name"] = app_name
+                            changed = True
                         
                         # Update image if changed
                         current_image_absolute = self.to_absolute_path(app.get("image", ""))
@@ -1089,6 +989,7 @@ class AppsFrame:
                             shutil.copy2(image_path, dest_image_path)
                             # Store as relative path
                             app["image"] = self.to_relative_path(str(dest_image_path))
+                            changed = True
                         
                         app_found = True
                         break
@@ -1097,6 +998,11 @@ class AppsFrame:
                     status_label.config(text="App not found in library")
                     return
                 
+                # Nothing was edited - skip rewriting the JSON and rebuilding the grid
+                if not changed:
+                    popup.destroy()
+                    return
+                
                 # Save apps
                 self.save_apps_json(apps_list)
                 
@@ -5,16 +5,45 @@ Admin control panel for system management
 """
 
 import tkinter as tk
-from pathlib import Path
+import importlib
+import logging
 import sys
 
+logger = logging.getLogger(__name__)
+
 
 class ControlPanelFrame:
+    # Map panel keys to their module and class names
+    PANEL_MAP = {
+        "accountsettings": ("accountsettings", "AccountSettingsPanel"),
+        "dashboardconfigs": ("dashboardconfigs", "DashboardConfigsPanel"),
+        "libraryconfigs": ("libraryconfigs", "LibraryConfigsPanel"),
+        "emulatorsettings": ("emulatorsettings", "EmulatorSettingsPanel"),
+        "romsettings": ("romsettings", "RomSettingsPanel"),
+        "themesettings": ("themesettings", "ThemeSettingsPanel"),
+        "generalsettings": ("generalsettings", "GeneralSettingsPanel"),
+        "displaysettings": ("displaysettings", "DisplaySettingsPanel"),
+        "controllersettings": ("controllersettings", "ControllerSettingsPanel"),
+        "storageconfigs": ("storageconfigs", "StorageConfigsPanel")
+    }
+    
     def __init__(self, parent, theme, scaler):
         self.parent = parent
         self.theme = theme
         self.scaler = scaler
         self.current_panel = None
+        # Panels built so far, kept so switching back to one doesn't rebuild it
+        self._panel_cache = {}
+        # Key of the highlighted menu button
+        self._active_key = None
+        # Panel classes already imported, keyed by panel key
+        self._panel_classes = {}
+        
+        # Add panels directory to path for imports
+        from theme_manager import get_app_root
+        panels_dir = str(get_app_root() / "data" / "frames" / "controlpanels")
+        if panels_dir not in sys.path:
+            sys.path.insert(0, panels_dir)
         
         bg_color = self.theme.get_color("background", "#000000")
         text_color = self.theme.get_color("text_primary", "#FFFFFF")
@@ -79,8 +108,18 @@ class ControlPanelFrame:
             ("Theme Settings", "themesettings")
         ]
         
+        # Menu button colors, also used by load_panel to highlight the selected button
+        self._active_bg = self.theme.get_color("primary", "#9D4EDD")
+        self._inactive_bg = menu_bar_color
+        
+        # Same padding for every menu button, so scale it once
+        button_padx = self.scaler.scale_padding(15)
+        button_pady = self.scaler.scale_padding(10)
+        outer_padx = self.scaler.scale_padding(10)
+        outer_pady = self.scaler.scale_padding(5)
+        
         self.menu_buttons = {}
-        for idx, (item_text, item_key) in enumerate(menu_items):
+        for item_text, item_key in menu_items:
             btn = tk.Button(
                 menu_container,
                 text=item_text,
@@ -91,58 +130,58 @@ class ControlPanelFrame:
                 relief=tk.FLAT,
                 borderwidth=0,
                 anchor="w",
-                padx=self.scaler.scale_padding(15),
-                pady=self.scaler.scale_padding(10),
-                activebackground=self.theme.get_color("primary", "#9D4EDD"),
+                padx=button_padx,
+                pady=button_pady,
+                activebackground=self._active_bg,
                 activeforeground=text_color,
                 command=lambda k=item_key: self.load_panel(k)
             )
-            btn.pack(fill=tk.X, padx=self.scaler.scale_padding(10), pady=self.scaler.scale_padding(5))
+            btn.pack(fill=tk.X, padx=outer_padx, pady=outer_pady)
             self.menu_buttons[item_key] = btn
-        
-        # Load default panel (Account Settings)
-        self.load_panel("accountsettings")
     
     def load_panel(self, panel_key):
         """Load a panel based on the key"""
-        # Highlight the selected menu button
-        for key, btn in self.menu_buttons.items():
-            if key == panel_key:
-                btn.config(bg=self.theme.get_color("primary", "#9D4EDD"))
-            else:
-                btn.config(bg=self.theme.get_color("menu_bar", "#2D2D2D"))
+        # Clicking the panel that is already showing has nothing to do
+        if panel_key == self._active_key and self.current_panel is not None:
+            return
+        
+        # Highlight the selected menu button - only the old and new buttons change
+        if self._active_key != panel_key:
+            if self._active_key in self.menu_buttons:
+                self.menu_buttons[self._active_key].config(bg=self._inactive_bg)
+            if panel_key in self.menu_buttons:
+                self.menu_buttons[panel_key].config(bg=self._active_bg)
+            self._active_key = panel_key
         
-        # Clear current panel
+        # Hide the current panel - built panels stay cached, error labels are thrown away
         if self.current_panel:
-            self.current_panel.destroy()
+            if hasattr(self.current_panel, 'frame'):
+                self.current_panel.frame.grid_remove()
+            else:
+                self.current_panel.destroy()
+            self.current_panel = None
         
-        # Add frames directory to path for imports
-        from theme_manager import get_app_root
-        app_root = get_app_root()
-        panels_dir = app_root / "data" / "frames" / "controlpanels"
-        if str(panels_dir) not in sys.path:
-            sys.path.insert(0, str(panels_dir))
+        cached_panel = self._panel_cache.get(panel_key)
+        if cached_panel:
+            cached_panel.frame.grid()
+            # Panels sharing a config file may have saved it while this one was hidden
+            if hasattr(cached_panel, 'load_settings'):
+                cached_panel.load_settings()
+            # Give the panel keyboard focus back for arrow key scrolling
+            if hasattr(cached_panel, 'canvas'):
+                cached_panel.canvas.focus_set()
+            self.current_panel = cached_panel
+            return
         
         try:
-            # Map panel keys to their module and class names
-            panel_map = {
-                "accountsettings": ("accountsettings", "AccountSettingsPanel"),
-                "dashboardconfigs": ("dashboardconfigs", "DashboardConfigsPanel"),
-                "libraryconfigs": ("libraryconfigs", "LibraryConfigsPanel"),
-                "emulatorsettings": ("emulatorsettings", "EmulatorSettingsPanel"),
-                "romsettings": ("romsettings", "RomSettingsPanel"),
-                "themesettings": ("themesettings", "ThemeSettingsPanel"),
-                "generalsettings": ("generalsettings", "GeneralSettingsPanel"),
-                "displaysettings": ("displaysettings", "DisplaySettingsPanel"),
-                "controllersettings": ("controllersettings", "ControllerSettingsPanel"),
-                "storageconfigs": ("storageconfigs", "StorageConfigsPanel")
-            }
-            
-            module_name, class_name = panel_map.get(panel_key, ("accountsettings", "AccountSettingsPanel"))
-            
-            # Dynamically import the panel module
-            module = __import__(module_name)
-            panel_class = getattr(module, class_name)
+            panel_class = self._panel_classes.get(panel_key)
+            if panel_class is None:
+                module_name, class_name = self.PANEL_MAP.get(panel_key, ("accountsettings", "AccountSettingsPanel"))
+                
+                # Dynamically import the panel module
+                module = importlib.import_module(module_name)
+                panel_class = getattr(module, class_name)
+                self._panel_classes[panel_key] = panel_class
             
             # Create and display the panel
             self.current_panel = panel_class(self.content_area, self.theme, self.scaler)
@@ -151,29 +190,40 @@ class ControlPanelFrame:
                 self.current_panel.frame.grid(row=0, column=0, sticky="nsew")
                 self.content_area.grid_rowconfigure(0, weight=1)
                 self.content_area.grid_columnconfigure(0, weight=1)
+                self._panel_cache[panel_key] = self.current_panel
+                # Cached panels are hidden, never destroyed by load_panel, so their own
+                # destroy() doesn't run when the dashboard tears the control panel down.
+                # Flush a pending debounced save while the panel's frame still exists
+                if hasattr(self.current_panel, 'flush_settings'):
+                    self.current_panel.frame.bind(
+                        "<Destroy>",
+                        lambda event, panel=self.current_panel: (
+                            panel.flush_settings() if event.widget is panel.frame else None
+                        ),
+                        add="+"
+                    )
             
-            # Update canvas if panel has one (for account settings and other scrollable panels)
-            def update_panel_canvas():
-                if hasattr(self.current_panel, 'canvas') and hasattr(self.current_panel, 'canvas_window'):
-                    self.current_panel.canvas.update_idletasks()
-                    canvas_width = self.current_panel.canvas.winfo_width()
+            # Size the panel's canvas once it has been laid out. Later resizes are
+            # handled by the panel's own <Configure> binding on its canvas
+            panel = self.current_panel
+            if hasattr(panel, 'canvas') and hasattr(panel, 'canvas_window'):
+                def update_panel_canvas():
+                    if not panel.canvas.winfo_exists():
+                        return
+                    panel.canvas.update_idletasks()
+                    canvas_width = panel.canvas.winfo_width()
                     if canvas_width > 1:
-                        self.current_panel.canvas.itemconfig(self.current_panel.canvas_window, width=canvas_width)
-                        bbox = self.current_panel.canvas.bbox("all")
+                        panel.canvas.itemconfig(panel.canvas_window, width=canvas_width)
+                        bbox = panel.canvas.bbox("all")
                         if bbox:
-                            self.current_panel.canvas.configure(scrollregion=bbox)
+                            panel.canvas.configure(scrollregion=bbox)
                     # Also trigger configure event to ensure proper sizing
-                    self.current_panel.canvas.event_generate("<Configure>", width=canvas_width)
-            
-            # Update after panel is created (multiple delays to ensure it works)
-            self.parent.after(50, update_panel_canvas)
-            self.parent.after(150, update_panel_canvas)
-            self.parent.after(300, update_panel_canvas)
+                    panel.canvas.event_generate("<Configure>", width=canvas_width)
+                
+                self.parent.after_idle(update_panel_canvas)
                 
         except Exception as e:
-            print(f"Error loading panel {panel_key}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error loading panel %s", panel_key)
             # Show error message
             error_label = tk.Label(
                 self.content_area,
@@ -189,6 +239,10 @@ class ControlPanelFrame:
         """Show the frame"""
         # Frame is already placed with grid in __init__, just ensure it's visible
         self.frame.grid(row=0, column=0, sticky="nsew")
+        
+        # Load default panel (Account Settings) the first time the frame is shown
+        if self.current_panel is None:
+            self.load_panel("accountsettings")
     
     def hide(self):
         """Hide the frame"""
@@ -4,26 +4,94 @@ Linux Gaming Center - Account Settings Panel
 """
 
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import ttk, messagebox
 from pathlib import Path
 import json
-import hashlib
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import sys
+from typing import NamedTuple
+
+_ROOT = str(Path(__file__).parent.parent.parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+from path_helper import get_accounts_path, get_config_file_path
+from json_helper import write_json
+from ui_helper import apply_treeview_style
+from password_helper import hash_password
+
+
+# Theme colors the panel uses, with the fallbacks for themes that don't set them
+_DEFAULT_COLORS = {
+    "background": "#000000",
+    "background_secondary": "#1A1A1A",
+    "text_primary": "#FFFFFF",
+    "text_secondary": "#E0E0E0",
+    "text_error": "#E74C3C",
+    "text_success": "#4CAF50",
+    "input_background": "#1A1A1A",
+    "input_text": "#FFFFFF",
+    "primary": "#9D4EDD",
+    "menu_bar": "#2D2D2D",
+}
+
+
+# Keys that scroll the panel, mapped to (amount, "units"/"page") for yview_scroll
+# or (fraction, "moveto") for yview_moveto
+_SCROLL_KEYS = {
+    "Up": (-3, "units"),
+    "Down": (3, "units"),
+    "Page_Up": (-1, "page"),
+    "Page_Down": (1, "page"),
+    "Home": (0, "moveto"),
+    "End": (1, "moveto"),
+}
+
+
+class Account(NamedTuple):
+    """An account as listed in the panel, read from its account.json"""
+    username: str
+    account_type: str
+    locked: bool
+    account_dir: Path
+    account_file: Path
 
 
 class AccountSettingsPanel:
+    # Rows shown in the accounts list before it scrolls
+    ACCOUNT_LIST_ROWS = 8
+    
     def __init__(self, parent, theme, scaler):
         self.parent = parent
         self.theme = theme
         self.scaler = scaler
         
-        bg_color = self.theme.get_color("background", "#000000")
-        text_color = self.theme.get_color("text_primary", "#FFFFFF")
-        text_secondary = self.theme.get_color("text_secondary", "#E0E0E0")
-        input_bg = self.theme.get_color("input_background", "#1A1A1A")
-        input_text = self.theme.get_color("input_text", "#FFFFFF")
-        primary_color = self.theme.get_color("primary", "#9D4EDD")
-        menu_bar_color = self.theme.get_color("menu_bar", "#2D2D2D")
+        # Theme colors and fonts used throughout the panel, looked up once
+        self._colors = {key: self.theme.get_color(key, default) for key, default in _DEFAULT_COLORS.items()}
+        self._fonts = {
+            name: self.theme.get_font(name, scaler=self.scaler)
+            for name in ("heading", "label", "body", "button", "button_small")
+        }
+        # Account list row tag and status text, and lock button text, keyed by locked
+        self._status_styles = {
+            True: ("locked", "Locked", "Unlock"),
+            False: ("unlocked", "Unlocked", "Lock"),
+        }
+        # Admin button text keyed by whether the account is an administrator
+        self._admin_button_texts = {True: "Remove Admin", False: "Make Admin"}
+        # Scaled padding for the handful of base sizes the panel uses
+        self._pad = {n: self.scaler.scale_padding(n) for n in (3, 5, 8, 10, 15, 20, 30)}
+        
+        bg_color = self._colors["background"]
+        text_color = self._colors["text_primary"]
+        text_secondary = self._colors["text_secondary"]
+        input_bg = self._colors["input_background"]
+        input_text = self._colors["input_text"]
+        primary_color = self._colors["primary"]
+        menu_bar_color = self._colors["menu_bar"]
         
         self.frame = tk.Frame(parent, bg=bg_color)
         # Use grid to fill parent completely
@@ -36,12 +104,18 @@ class AccountSettingsPanel:
         self.frame.grid_columnconfigure(0, weight=1)
         
         # Accounts directory
-        import sys
-        from pathlib import Path
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-        from path_helper import get_accounts_path, get_config_file_path
         self.accounts_dir = get_accounts_path()
         self.config_file = get_config_file_path("config.json")
+        self._config = self._load_config()
+        
+        # Pending after() id for the debounced account creation save, and the lock
+        # that keeps background writes of config.json from overlapping
+        self._save_after_id = None
+        self._save_lock = threading.Lock()
+        
+        # Worker for password hashing, account creation and account deletion, which
+        # are too slow to run on the Tk thread
+        self._executor = ThreadPoolExecutor(max_workers=1)
         
         # Scrollable canvas for content (no visible scrollbar) - fills entire frame
         self.canvas = tk.Canvas(self.frame, bg=bg_color, highlightthickness=0)
@@ -49,37 +123,33 @@ class AccountSettingsPanel:
         
         self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         
-        def configure_scroll_region(event=None):
-            self.canvas.update_idletasks()
+        # Width the canvas window was last stretched to, and the pending after() id
+        # for the debounced scroll region update
+        self._last_canvas_width = None
+        self._resize_after_id = None
+        
+        def update_scroll_region():
+            self._resize_after_id = None
             bbox = self.canvas.bbox("all")
             if bbox:
                 self.canvas.configure(scrollregion=bbox)
-            # Always update canvas window width to match canvas
-            canvas_width = event.width if event else self.canvas.winfo_width()
-            if canvas_width > 1:
+            # Keep the canvas window as wide as the canvas
+            canvas_width = self.canvas.winfo_width()
+            if canvas_width > 1 and canvas_width != self._last_canvas_width:
+                self._last_canvas_width = canvas_width
                 self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-            # Also update on initial load
-            if not event:
-                self.canvas.update_idletasks()
-                canvas_width = self.canvas.winfo_width()
-                if canvas_width > 1:
-                    self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+        
+        def configure_scroll_region(event=None):
+            # Resizing fires a burst of Configure events - only update once a frame
+            if self._resize_after_id:
+                self.canvas.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.canvas.after(16, update_scroll_region)
         
         self.scrollable_frame.bind("<Configure>", configure_scroll_region)
         self.canvas.bind("<Configure>", configure_scroll_region)
         
-        # Force initial canvas width update after a short delay
-        def update_canvas_width():
-            self.canvas.update_idletasks()
-            canvas_width = self.canvas.winfo_width()
-            if canvas_width > 1:
-                self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-                bbox = self.canvas.bbox("all")
-                if bbox:
-                    self.canvas.configure(scrollregion=bbox)
-        
-        self.parent.after(50, update_canvas_width)
-        self.parent.after(200, update_canvas_width)
+        # Initial width and scroll region once the panel has been laid out
+        self.parent.after_idle(configure_scroll_region)
         
         # Use grid to fill entire frame
         self.canvas.grid(row=0, column=0, sticky="nsew")
@@ -103,30 +173,25 @@ class AccountSettingsPanel:
             if self.canvas.yview()[1] < 1.0:
                 self.canvas.yview_scroll(3, "units")
         
-        # Bind mousewheel events
-        self.canvas.bind("<MouseWheel>", on_mousewheel)
-        self.scrollable_frame.bind("<MouseWheel>", on_mousewheel)
-        self.canvas.bind("<Button-4>", scroll_up)
-        self.canvas.bind("<Button-5>", scroll_down)
-        self.scrollable_frame.bind("<Button-4>", scroll_up)
-        self.scrollable_frame.bind("<Button-5>", scroll_down)
+        # Bind mousewheel events once on a bindtag shared by the canvas and every widget
+        # inside it (see join_scroll_tag), so the wheel also works over the sections
+        self._scroll_tag = f"AccountScroll{id(self)}"
+        self.frame.bind_class(self._scroll_tag, "<MouseWheel>", on_mousewheel)
+        self.frame.bind_class(self._scroll_tag, "<Button-4>", scroll_up)
+        self.frame.bind_class(self._scroll_tag, "<Button-5>", scroll_down)
         
         # Arrow key scrolling
         def on_arrow_key(event):
-            if event.keysym == "Up":
-                if self.canvas.yview()[0] > 0.0:
-                    self.canvas.yview_scroll(-3, "units")
-            elif event.keysym == "Down":
-                if self.canvas.yview()[1] < 1.0:
-                    self.canvas.yview_scroll(3, "units")
-            elif event.keysym == "Page_Up":
-                self.canvas.yview_scroll(-1, "page")
-            elif event.keysym == "Page_Down":
-                self.canvas.yview_scroll(1, "page")
-            elif event.keysym == "Home":
-                self.canvas.yview_moveto(0)
-            elif event.keysym == "End":
-                self.canvas.yview_moveto(1)
+            # Other keys pass straight through
+            scroll = _SCROLL_KEYS.get(event.keysym)
+            if scroll is None:
+                return
+            # The canvas clamps scrolling to the scroll region itself
+            amount, what = scroll
+            if what == "moveto":
+                self.canvas.yview_moveto(amount)
+            else:
+                self.canvas.yview_scroll(amount, what)
             return "break"
         
         # Bind arrow keys
@@ -139,7 +204,7 @@ class AccountSettingsPanel:
         self.canvas.focus_set()
         
         # Title
-        heading_font = self.theme.get_font("heading", scaler=self.scaler)
+        heading_font = self._fonts["heading"]
         title_label = tk.Label(
             self.scrollable_frame,
             text="Account Settings",
@@ -147,7 +212,7 @@ class AccountSettingsPanel:
             bg=bg_color,
             fg=text_color
         )
-        title_label.pack(pady=self.scaler.scale_padding(20))
+        title_label.pack(pady=self._pad[20])
         
         # 1. Account Creation Toggle
         self.create_account_creation_section(self.scrollable_frame, bg_color, text_color, text_secondary, primary_color)
@@ -158,19 +223,24 @@ class AccountSettingsPanel:
         # 3. Create Account Section
         self.create_new_account_section(self.scrollable_frame, bg_color, text_color, text_secondary, primary_color, input_bg, input_text)
         
-        # Update canvas scroll region
-        self.canvas.update_idletasks()
-        bbox = self.canvas.bbox("all")
-        if bbox:
-            self.canvas.configure(scrollregion=bbox)
+        self.join_scroll_tag(self.canvas)
+    
+    def join_scroll_tag(self, widget):
+        """Add the mousewheel bindtag to widget and everything inside it"""
+        # The accounts list scrolls itself
+        if isinstance(widget, ttk.Treeview):
+            return
+        widget.bindtags((self._scroll_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self.join_scroll_tag(child)
     
     def create_account_creation_section(self, parent, bg_color, text_color, text_secondary, primary_color):
         """Create section for toggling account creation"""
         section_frame = tk.Frame(parent, bg=bg_color)
-        section_frame.pack(fill=tk.X, padx=self.scaler.scale_padding(20), pady=self.scaler.scale_padding(20))
+        section_frame.pack(fill=tk.X, padx=self._pad[20], pady=self._pad[20])
         
-        label_font = self.theme.get_font("label", scaler=self.scaler)
-        body_font = self.theme.get_font("body", scaler=self.scaler)
+        label_font = self._fonts["label"]
+        body_font = self._fonts["body"]
         
         title = tk.Label(
             section_frame,
@@ -180,7 +250,7 @@ class AccountSettingsPanel:
             fg=text_color,
             anchor="w"
         )
-        title.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(10)))
+        title.pack(fill=tk.X, pady=(0, self._pad[10]))
         
         toggle_frame = tk.Frame(section_frame, bg=bg_color)
         toggle_frame.pack(fill=tk.X)
@@ -209,40 +279,51 @@ class AccountSettingsPanel:
         )
         toggle_btn.pack(side=tk.RIGHT)
     
-    def get_account_creation_enabled(self):
-        """Check if account creation is enabled"""
+    def _load_config(self):
+        """Read config.json, kept in self._config so toggles don't re-read it"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                return config.get("allow_account_creation", True)  # Default to True
+                return json.loads(self.config_file.read_bytes())
             except:
-                return True
-        return True
+                pass
+        return {}
+    
+    def get_account_creation_enabled(self):
+        """Check if account creation is enabled"""
+        return self._config.get("allow_account_creation", True)  # Default to True
     
     def toggle_account_creation(self):
-        """Toggle account creation setting"""
-        try:
-            config = {}
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-            
-            config["allow_account_creation"] = self.account_creation_var.get()
-            
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to update setting: {str(e)}")
+        """Toggle account creation setting
+        
+        Rapid clicks are coalesced into a single save 500ms after the last one.
+        """
+        if self._save_after_id:
+            self.frame.after_cancel(self._save_after_id)
+        self._save_after_id = self.frame.after(500, self.flush_account_creation)
+    
+    def flush_account_creation(self):
+        """Write the account creation setting on a background thread"""
+        self._save_after_id = None
+        self._config["allow_account_creation"] = self.account_creation_var.get()
+        # Hand the thread a copy so later toggles can't change it mid-write
+        threading.Thread(target=self.save_config, args=(dict(self._config),), daemon=True).start()
+    
+    def save_config(self, config):
+        """Write config to config.json"""
+        with self._save_lock:
+            try:
+                self.config_file.parent.mkdir(parents=True, exist_ok=True)
+                write_json(self.config_file, config)
+            except Exception as e:
+                print(f"Error saving account creation setting: {e}")
     
     def create_accounts_list_section(self, parent, bg_color, text_color, text_secondary, primary_color, menu_bar_color, input_bg, input_text):
         """Create section for listing and managing accounts"""
         section_frame = tk.Frame(parent, bg=bg_color)
-        section_frame.pack(fill=tk.BOTH, expand=True, padx=self.scaler.scale_padding(20), pady=self.scaler.scale_padding(20))
+        section_frame.pack(fill=tk.BOTH, expand=True, padx=self._pad[20], pady=self._pad[20])
         
-        label_font = self.theme.get_font("label", scaler=self.scaler)
-        body_font = self.theme.get_font("body", scaler=self.scaler)
+        label_font = self._fonts["label"]
+        body_font = self._fonts["body"]
         
         title = tk.Label(
             section_frame,
@@ -252,191 +333,200 @@ class AccountSettingsPanel:
             fg=text_color,
             anchor="w"
         )
-        title.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(10)))
+        title.pack(fill=tk.X, pady=(0, self._pad[10]))
         
         # Accounts list container
         list_container = tk.Frame(section_frame, bg=bg_color)
         list_container.pack(fill=tk.BOTH, expand=True)
         
         # Refresh button
-        button_font = self.theme.get_font("button", scaler=self.scaler)
+        button_font = self._fonts["button"]
         refresh_btn = tk.Button(
             list_container,
             text="Refresh List",
             font=button_font,
-            command=lambda: self.refresh_accounts_list(list_container, bg_color, text_color, text_secondary, primary_color, menu_bar_color, input_bg, input_text),
+            command=self.refresh_accounts_list,
             bg=primary_color,
             fg=text_color,
             cursor="hand2",
             relief=tk.FLAT,
-            padx=self.scaler.scale_padding(15),
-            pady=self.scaler.scale_padding(8)
+            padx=self._pad[15],
+            pady=self._pad[8]
         )
-        refresh_btn.pack(anchor="w", pady=(0, self.scaler.scale_padding(10)))
-        
-        # Accounts list frame
-        self.accounts_list_frame = tk.Frame(list_container, bg=bg_color)
-        self.accounts_list_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Load accounts initially
-        self.refresh_accounts_list(list_container, bg_color, text_color, text_secondary, primary_color, menu_bar_color, input_bg, input_text)
-    
-    def refresh_accounts_list(self, parent, bg_color, text_color, text_secondary, primary_color, menu_bar_color, input_bg, input_text):
-        """Refresh the accounts list"""
-        # Clear existing accounts
-        for widget in self.accounts_list_frame.winfo_children():
-            widget.destroy()
-        
-        if not self.accounts_dir.exists():
-            no_accounts = tk.Label(
-                self.accounts_list_frame,
-                text="No accounts found",
-                font=self.theme.get_font("body", scaler=self.scaler),
-                bg=bg_color,
-                fg=text_secondary
+        refresh_btn.pack(anchor="w", pady=(0, self._pad[10]))
+        
+        # Actions for the selected account
+        action_bar = tk.Frame(list_container, bg=bg_color)
+        action_bar.pack(fill=tk.X, pady=(0, self._pad[10]))
+        
+        button_small_font = self._fonts["button_small"]
+        self._account_buttons = []
+        for text, action, color in (
+            ("Change Password", self.change_password, primary_color),
+            ("Lock", self.toggle_lock_account, primary_color),
+            ("Make Admin", self.toggle_admin_status, primary_color),
+            ("Delete", self.delete_account, self._colors["text_error"]),
+        ):
+            button = tk.Button(
+                action_bar,
+                text=text,
+                font=button_small_font,
+                command=partial(self.run_selected_action, action),
+                bg=color,
+                fg=text_color,
+                cursor="hand2",
+                relief=tk.FLAT,
+                state=tk.DISABLED,
+                padx=self._pad[10],
+                pady=self._pad[5]
             )
-            no_accounts.pack(pady=self.scaler.scale_padding(20))
+            button.pack(side=tk.LEFT, padx=(0, self._pad[5]))
+            self._account_buttons.append(button)
+        self.lock_btn = self._account_buttons[1]
+        self.admin_btn = self._account_buttons[2]
+        
+        # Accounts list - Treeview draws its rows itself, so the list costs no
+        # widgets per account
+        apply_treeview_style(self.theme, body_font, label_font, self._pad[30])
+        self.accounts_tree = ttk.Treeview(
+            list_container,
+            columns=("username", "type", "status"),
+            show="headings",
+            selectmode="browse",
+            height=self.ACCOUNT_LIST_ROWS
+        )
+        for column, heading in (("username", "Username"), ("type", "Type"), ("status", "Status")):
+            self.accounts_tree.heading(column, text=heading, anchor="w")
+        self.accounts_tree.tag_configure("locked", foreground=self._colors["text_error"])
+        self.accounts_tree.tag_configure("unlocked", foreground=self._colors["text_success"])
+        self.accounts_tree.pack(fill=tk.BOTH, expand=True)
+        self.accounts_tree.bind("<<TreeviewSelect>>", lambda e: self.update_account_buttons())
+        
+        # Accounts currently listed, and the same keyed by tree item id
+        self._accounts = None
+        self._accounts_by_iid = {}
+        self._no_accounts_label = None
+        # Names of the directories in accounts_dir as of the last load_accounts
+        self._account_names = set()
+        
+        # Load accounts once the rest of the panel has been drawn
+        self.parent.after_idle(self.refresh_accounts_list)
+    
+    def refresh_accounts_list(self):
+        """Reload the accounts and refill the list"""
+        accounts = self.load_accounts()
+        # Nothing to redraw if no account was added, removed or changed
+        if accounts == self._accounts:
             return
+        self._accounts = accounts
         
-        # Get all accounts
-        accounts = []
-        for account_dir in self.accounts_dir.iterdir():
-            if account_dir.is_dir():
-                account_file = account_dir / "account.json"
-                if account_file.exists():
-                    try:
-                        with open(account_file, 'r') as f:
-                            account_data = json.load(f)
-                        accounts.append({
-                            "username": account_data.get("username", account_dir.name),
-                            "account_type": account_data.get("account_type", "basic"),
-                            "locked": account_data.get("locked", False),
-                            "account_dir": account_dir,
-                            "account_file": account_file
-                        })
-                    except:
-                        pass
+        tree = self.accounts_tree
+        selected = tree.selection()
+        tree.delete(*tree.get_children())
+        self._accounts_by_iid = {}
         
         if not accounts:
-            no_accounts = tk.Label(
-                self.accounts_list_frame,
-                text="No accounts found",
-                font=self.theme.get_font("body", scaler=self.scaler),
-                bg=bg_color,
-                fg=text_secondary
-            )
-            no_accounts.pack(pady=self.scaler.scale_padding(20))
+            if self._no_accounts_label is None:
+                self._no_accounts_label = tk.Label(
+                    tree.master,
+                    text="No accounts found",
+                    font=self._fonts["body"],
+                    bg=self._colors["background"],
+                    fg=self._colors["text_secondary"]
+                )
+                self.join_scroll_tag(self._no_accounts_label)
+            tree.pack_forget()
+            self._no_accounts_label.pack(pady=self._pad[20])
+            self.update_account_buttons()
             return
         
-        # Display each account
-        body_font = self.theme.get_font("body", scaler=self.scaler)
-        button_font = self.theme.get_font("button_small", scaler=self.scaler)
-        
+        self.show_accounts_tree()
         for account in accounts:
-            account_frame = tk.Frame(self.accounts_list_frame, bg=menu_bar_color, relief=tk.FLAT, borderwidth=1)
-            account_frame.pack(fill=tk.X, pady=self.scaler.scale_padding(5), padx=self.scaler.scale_padding(5))
-            
-            # Account info
-            info_frame = tk.Frame(account_frame, bg=menu_bar_color)
-            info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=self.scaler.scale_padding(10), pady=self.scaler.scale_padding(10))
-            
-            username_label = tk.Label(
-                info_frame,
-                text=f"Username: {account['username']}",
-                font=body_font,
-                bg=menu_bar_color,
-                fg=text_color,
-                anchor="w"
-            )
-            username_label.pack(fill=tk.X)
-            
-            type_label = tk.Label(
-                info_frame,
-                text=f"Type: {account['account_type'].capitalize()}",
-                font=body_font,
-                bg=menu_bar_color,
-                fg=text_secondary,
-                anchor="w"
-            )
-            type_label.pack(fill=tk.X)
-            
-            status_text = "Locked" if account['locked'] else "Unlocked"
-            status_color = self.theme.get_color("text_error", "#E74C3C") if account['locked'] else self.theme.get_color("text_success", "#4CAF50")
-            status_label = tk.Label(
-                info_frame,
-                text=f"Status: {status_text}",
-                font=body_font,
-                bg=menu_bar_color,
-                fg=status_color,
-                anchor="w"
-            )
-            status_label.pack(fill=tk.X)
-            
-            # Buttons frame
-            buttons_frame = tk.Frame(account_frame, bg=menu_bar_color)
-            buttons_frame.pack(side=tk.RIGHT, padx=self.scaler.scale_padding(10), pady=self.scaler.scale_padding(10))
-            
-            # Change Password button
-            change_pass_btn = tk.Button(
-                buttons_frame,
-                text="Change Password",
-                font=button_font,
-                command=lambda acc=account: self.change_password(acc),
-                bg=primary_color,
-                fg=text_color,
-                cursor="hand2",
-                relief=tk.FLAT,
-                padx=self.scaler.scale_padding(10),
-                pady=self.scaler.scale_padding(5)
-            )
-            change_pass_btn.pack(side=tk.LEFT, padx=self.scaler.scale_padding(3))
-            
-            # Lock/Unlock button
-            lock_text = "Unlock" if account['locked'] else "Lock"
-            lock_btn = tk.Button(
-                buttons_frame,
-                text=lock_text,
-                font=button_font,
-                command=lambda acc=account: self.toggle_lock_account(acc),
-                bg=primary_color,
-                fg=text_color,
-                cursor="hand2",
-                relief=tk.FLAT,
-                padx=self.scaler.scale_padding(10),
-                pady=self.scaler.scale_padding(5)
-            )
-            lock_btn.pack(side=tk.LEFT, padx=self.scaler.scale_padding(3))
-            
-            # Change Admin Status button
-            admin_text = "Remove Admin" if account['account_type'] == "administrator" else "Make Admin"
-            admin_btn = tk.Button(
-                buttons_frame,
-                text=admin_text,
-                font=button_font,
-                command=lambda acc=account: self.toggle_admin_status(acc),
-                bg=primary_color,
-                fg=text_color,
-                cursor="hand2",
-                relief=tk.FLAT,
-                padx=self.scaler.scale_padding(10),
-                pady=self.scaler.scale_padding(5)
-            )
-            admin_btn.pack(side=tk.LEFT, padx=self.scaler.scale_padding(3))
-            
-            # Delete button
-            delete_btn = tk.Button(
-                buttons_frame,
-                text="Delete",
-                font=button_font,
-                command=lambda acc=account: self.delete_account(acc),
-                bg=self.theme.get_color("text_error", "#E74C3C"),
-                fg=text_color,
-                cursor="hand2",
-                relief=tk.FLAT,
-                padx=self.scaler.scale_padding(10),
-                pady=self.scaler.scale_padding(5)
-            )
-            delete_btn.pack(side=tk.LEFT, padx=self.scaler.scale_padding(3))
+            self.insert_account_row(account)
+        
+        # Keep the same account selected across refreshes
+        selected = [iid for iid in selected if iid in self._accounts_by_iid]
+        if selected:
+            tree.selection_set(selected)
+        self.update_account_buttons()
+    
+    def show_accounts_tree(self):
+        """Swap the "No accounts found" label back out for the list"""
+        if self._no_accounts_label is not None and self._no_accounts_label.winfo_manager():
+            self._no_accounts_label.pack_forget()
+            self.accounts_tree.pack(fill=tk.BOTH, expand=True)
+    
+    def insert_account_row(self, account):
+        """Add a row for account at the end of the list"""
+        tag, status_text = self._status_styles[bool(account.locked)][:2]
+        iid = self.accounts_tree.insert(
+            "", tk.END,
+            iid=str(account.account_dir),
+            values=(account.username, account.account_type.capitalize(), status_text),
+            tags=(tag,)
+        )
+        self._accounts_by_iid[iid] = account
+    
+    def add_account_to_list(self, account):
+        """Show a newly created account without reloading the whole list"""
+        if str(account.account_dir) in self._accounts_by_iid:
+            return
+        self._accounts = (self._accounts or []) + [account]
+        self._account_names.add(account.account_dir.name)
+        self.show_accounts_tree()
+        self.insert_account_row(account)
+    
+    def load_accounts(self):
+        """Read the account list from the accounts directory"""
+        accounts = []
+        try:
+            # scandir gets each entry's type from the directory listing, so only the
+            # account.json open costs a syscall per account
+            with os.scandir(self.accounts_dir) as entries:
+                account_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+        except OSError:
+            self._account_names = set()
+            return accounts
+        self._account_names = {account_dir.name for account_dir in account_dirs}
+        
+        for account_dir in account_dirs:
+            account_file = account_dir / "account.json"
+            try:
+                account_data = json.loads(account_file.read_bytes())
+                accounts.append(Account(
+                    username=account_data.get("username", account_dir.name),
+                    account_type=account_data.get("account_type", "basic"),
+                    locked=account_data.get("locked", False),
+                    account_dir=account_dir,
+                    account_file=account_file
+                ))
+            except:
+                # Missing or unreadable account.json
+                pass
+        return accounts
+    
+    def selected_account(self):
+        """Get the account selected in the list, or None"""
+        selection = self.accounts_tree.selection()
+        if not selection:
+            return None
+        return self._accounts_by_iid.get(selection[0])
+    
+    def run_selected_action(self, action):
+        """Action bar command: call action with the selected account"""
+        account = self.selected_account()
+        if account is not None:
+            action(account)
+    
+    def update_account_buttons(self):
+        """Enable and relabel the action bar for the selected account"""
+        account = self.selected_account()
+        state = tk.DISABLED if account is None else tk.NORMAL
+        for button in self._account_buttons:
+            button.configure(state=state)
+        if account is not None:
+            self.lock_btn.configure(text=self._status_styles[bool(account.locked)][2])
+            self.admin_btn.configure(text=self._admin_button_texts[account.account_type == "administrator"])
     
     def change_password(self, account):
         """Change account password"""
@@ -445,12 +535,12 @@ class AccountSettingsPanel:
         popup.transient(self.parent)
         popup.grab_set()
         
-        bg_color = self.theme.get_color("background_secondary", "#1A1A1A")
-        text_color = self.theme.get_color("text_primary", "#FFFFFF")
-        text_secondary = self.theme.get_color("text_secondary", "#E0E0E0")
-        input_bg = self.theme.get_color("input_background", "#1A1A1A")
-        input_text = self.theme.get_color("input_text", "#FFFFFF")
-        primary_color = self.theme.get_color("primary", "#9D4EDD")
+        bg_color = self._colors["background_secondary"]
+        text_color = self._colors["text_primary"]
+        text_secondary = self._colors["text_secondary"]
+        input_bg = self._colors["input_background"]
+        input_text = self._colors["input_text"]
+        primary_color = self._colors["primary"]
         
         popup.configure(bg=bg_color)
         popup_width = self.scaler.scale_dimension(400)
@@ -459,21 +549,21 @@ class AccountSettingsPanel:
         popup.geometry(f'{popup_width}x{popup_height}+{x}+{y}')
         popup.resizable(False, False)
         
-        label_font = self.theme.get_font("label", scaler=self.scaler)
-        body_font = self.theme.get_font("body", scaler=self.scaler)
-        button_font = self.theme.get_font("button", scaler=self.scaler)
+        label_font = self._fonts["label"]
+        body_font = self._fonts["body"]
+        button_font = self._fonts["button"]
         
         title = tk.Label(
             popup,
-            text=f"Change Password for {account['username']}",
+            text=f"Change Password for {account.username}",
             font=label_font,
             bg=bg_color,
             fg=text_color
         )
-        title.pack(pady=self.scaler.scale_padding(20))
+        title.pack(pady=self._pad[20])
         
         form_frame = tk.Frame(popup, bg=bg_color)
-        form_frame.pack(padx=self.scaler.scale_padding(30), pady=self.scaler.scale_padding(10), fill=tk.BOTH, expand=True)
+        form_frame.pack(padx=self._pad[30], pady=self._pad[10], fill=tk.BOTH, expand=True)
         
         # New password
         new_pass_label = tk.Label(
@@ -484,7 +574,7 @@ class AccountSettingsPanel:
             fg=text_secondary,
             anchor="w"
         )
-        new_pass_label.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(5)))
+        new_pass_label.pack(fill=tk.X, pady=(0, self._pad[5]))
         
         new_pass_var = tk.StringVar()
         new_pass_entry = tk.Entry(
@@ -495,10 +585,12 @@ class AccountSettingsPanel:
             fg=input_text,
             insertbackground=input_text,
             show="*",
-            relief=tk.SOLID,
-            borderwidth=1
+            relief=tk.FLAT,
+            highlightthickness=1,
+            highlightbackground=self._colors["menu_bar"],
+            highlightcolor=self._colors["primary"]
         )
-        new_pass_entry.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(15)), ipady=self.scaler.scale_padding(5))
+        new_pass_entry.pack(fill=tk.X, pady=(0, self._pad[15]), ipady=self._pad[5])
         
         # Confirm password
         confirm_pass_label = tk.Label(
@@ -509,7 +601,7 @@ class AccountSettingsPanel:
             fg=text_secondary,
             anchor="w"
         )
-        confirm_pass_label.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(5)))
+        confirm_pass_label.pack(fill=tk.X, pady=(0, self._pad[5]))
         
         confirm_pass_var = tk.StringVar()
         confirm_pass_entry = tk.Entry(
@@ -520,19 +612,21 @@ class AccountSettingsPanel:
             fg=input_text,
             insertbackground=input_text,
             show="*",
-            relief=tk.SOLID,
-            borderwidth=1
+            relief=tk.FLAT,
+            highlightthickness=1,
+            highlightbackground=self._colors["menu_bar"],
+            highlightcolor=self._colors["primary"]
         )
-        confirm_pass_entry.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(20)), ipady=self.scaler.scale_padding(5))
+        confirm_pass_entry.pack(fill=tk.X, pady=(0, self._pad[20]), ipady=self._pad[5])
         
         status_label = tk.Label(
             form_frame,
             text="",
             font=label_font,
             bg=bg_color,
-            fg=self.theme.get_color("text_error", "#E74C3C")
+            fg=self._colors["text_error"]
         )
-        status_label.pack(pady=(0, self.scaler.scale_padding(10)))
+        status_label.pack(pady=(0, self._pad[10]))
         
         def save_password():
             new_pass = new_pass_var.get()
@@ -546,23 +640,28 @@ class AccountSettingsPanel:
                 status_label.config(text="Passwords do not match")
                 return
             
-            try:
-                # Load account data
-                with open(account['account_file'], 'r') as f:
-                    account_data = json.load(f)
-                
-                # Update password
-                password_hash = hashlib.sha256(new_pass.encode()).hexdigest()
-                account_data['password_hash'] = password_hash
-                
-                # Save account data
-                with open(account['account_file'], 'w') as f:
-                    json.dump(account_data, f, indent=2)
+            # Hashing is deliberately slow, so it runs on the executor while the
+            # popup polls for the result
+            save_btn.config(state=tk.DISABLED)
+            status_label.config(text="Saving...", fg=text_secondary)
+            future = self._executor.submit(self.save_password_hash, account, new_pass)
+            
+            def check_saved():
+                if not popup.winfo_exists():
+                    return
+                if not future.done():
+                    popup.after(50, check_saved)
+                    return
                 
-                messagebox.showinfo("Success", f"Password changed for {account['username']}")
-                popup.destroy()
-            except Exception as e:
-                status_label.config(text=f"Error: {str(e)}")
+                error = future.exception()
+                if error is None:
+                    messagebox.showinfo("Success", f"Password changed for {account.username}")
+                    popup.destroy()
+                else:
+                    save_btn.config(state=tk.NORMAL)
+                    status_label.config(text=f"Error: {str(error)}", fg=self._colors["text_error"])
+            
+            popup.after(50, check_saved)
         
         save_btn = tk.Button(
             form_frame,
@@ -573,89 +672,66 @@ class AccountSettingsPanel:
             fg=text_color,
             cursor="hand2",
             relief=tk.FLAT,
-            padx=self.scaler.scale_padding(30),
-            pady=self.scaler.scale_padding(10)
+            padx=self._pad[30],
+            pady=self._pad[10]
         )
-        save_btn.pack(pady=(self.scaler.scale_padding(10), 0))
+        save_btn.pack(pady=(self._pad[10], 0))
+    
+    def save_password_hash(self, account, new_pass):
+        """Hash a new password and save it to the account file (runs on the executor)"""
+        self._update_account(account, password_hash=hash_password(new_pass))
+    
+    def _update_account(self, account, **changes):
+        """Apply changes to an account's account.json"""
+        account_file = account.account_file
+        account_data = json.loads(account_file.read_bytes())
+        account_data.update(changes)
+        write_json(account_file, account_data)
     
     def toggle_lock_account(self, account):
         """Lock or unlock an account"""
-        action = "unlock" if account['locked'] else "lock"
+        action = "unlock" if account.locked else "lock"
         confirm = messagebox.askyesno(
             "Confirm",
-            f"Are you sure you want to {action} account '{account['username']}'?"
+            f"Are you sure you want to {action} account '{account.username}'?"
         )
         
         if not confirm:
             return
         
         try:
-            # Load account data
-            with open(account['account_file'], 'r') as f:
-                account_data = json.load(f)
-            
             # Toggle lock status
-            account_data['locked'] = not account['locked']
-            
-            # Save account data
-            with open(account['account_file'], 'w') as f:
-                json.dump(account_data, f, indent=2)
+            self._update_account(account, locked=not account.locked)
             
-            messagebox.showinfo("Success", f"Account '{account['username']}' has been {action}ed")
+            messagebox.showinfo("Success", f"Account '{account.username}' has been {action}ed")
             
             # Refresh accounts list
-            self.refresh_accounts_list(
-                self.accounts_list_frame.master,
-                self.theme.get_color("background", "#000000"),
-                self.theme.get_color("text_primary", "#FFFFFF"),
-                self.theme.get_color("text_secondary", "#E0E0E0"),
-                self.theme.get_color("primary", "#9D4EDD"),
-                self.theme.get_color("menu_bar", "#2D2D2D"),
-                self.theme.get_color("input_background", "#1A1A1A"),
-                self.theme.get_color("input_text", "#FFFFFF")
-            )
+            self.refresh_accounts_list()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to {action} account: {str(e)}")
     
     def toggle_admin_status(self, account):
         """Toggle admin status of an account"""
-        action = "remove admin from" if account['account_type'] == "administrator" else "make admin"
+        action = "remove admin from" if account.account_type == "administrator" else "make admin"
         confirm = messagebox.askyesno(
             "Confirm",
-            f"Are you sure you want to {action} '{account['username']}'?"
+            f"Are you sure you want to {action} '{account.username}'?"
         )
         
         if not confirm:
             return
         
         try:
-            # Load account data
-            with open(account['account_file'], 'r') as f:
-                account_data = json.load(f)
-            
             # Toggle admin status
-            if account['account_type'] == "administrator":
-                account_data['account_type'] = "basic"
+            if account.account_type == "administrator":
+                self._update_account(account, account_type="basic")
             else:
-                account_data['account_type'] = "administrator"
+                self._update_account(account, account_type="administrator")
             
-            # Save account data
-            with open(account['account_file'], 'w') as f:
-                json.dump(account_data, f, indent=2)
-            
-            messagebox.showinfo("Success", f"Account '{account['username']}' admin status updated")
+            messagebox.showinfo("Success", f"Account '{account.username}' admin status updated")
             
             # Refresh accounts list
-            self.refresh_accounts_list(
-                self.accounts_list_frame.master,
-                self.theme.get_color("background", "#000000"),
-                self.theme.get_color("text_primary", "#FFFFFF"),
-                self.theme.get_color("text_secondary", "#E0E0E0"),
-                self.theme.get_color("primary", "#9D4EDD"),
-                self.theme.get_color("menu_bar", "#2D2D2D"),
-                self.theme.get_color("input_background", "#1A1A1A"),
-                self.theme.get_color("input_text", "#FFFFFF")
-            )
+            self.refresh_accounts_list()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update admin status: {str(e)}")
     
@@ -663,42 +739,50 @@ class AccountSettingsPanel:
         """Delete an account"""
         confirm = messagebox.askyesno(
             "Confirm Deletion",
-            f"Are you sure you want to delete account '{account['username']}'?\n\nThis will permanently delete all account data and cannot be undone.",
+            f"Are you sure you want to delete account '{account.username}'?\n\nThis will permanently delete all account data and cannot be undone.",
             icon="warning"
         )
         
         if not confirm:
             return
         
-        try:
-            # Delete account directory
-            if account['account_dir'].exists():
-                shutil.rmtree(account['account_dir'])
+        # Removing a large account directory can take a while, so it runs on the
+        # executor with a busy cursor until it is done
+        self.frame.configure(cursor="watch")
+        future = self._executor.submit(self.remove_account_dir, account)
+        
+        def check_deleted():
+            if not self.frame.winfo_exists():
+                return
+            if not future.done():
+                self.frame.after(50, check_deleted)
+                return
             
-            messagebox.showinfo("Success", f"Account '{account['username']}' has been deleted")
+            self.frame.configure(cursor="")
+            error = future.exception()
+            if error is None:
+                messagebox.showinfo("Success", f"Account '{account.username}' has been deleted")
+            else:
+                messagebox.showerror("Error", f"Failed to delete account: {str(error)}")
             
             # Refresh accounts list
-            self.refresh_accounts_list(
-                self.accounts_list_frame.master,
-                self.theme.get_color("background", "#000000"),
-                self.theme.get_color("text_primary", "#FFFFFF"),
-                self.theme.get_color("text_secondary", "#E0E0E0"),
-                self.theme.get_color("primary", "#9D4EDD"),
-                self.theme.get_color("menu_bar", "#2D2D2D"),
-                self.theme.get_color("input_background", "#1A1A1A"),
-                self.theme.get_color("input_text", "#FFFFFF")
-            )
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to delete account: {str(e)}")
+            self.refresh_accounts_list()
+        
+        self.frame.after(50, check_deleted)
+    
+    def remove_account_dir(self, account):
+        """Delete an account's directory (runs on the executor)"""
+        if account.account_dir.exists():
+            shutil.rmtree(account.account_dir)
     
     def create_new_account_section(self, parent, bg_color, text_color, text_secondary, primary_color, input_bg, input_text):
         """Create section for creating new accounts"""
         section_frame = tk.Frame(parent, bg=bg_color)
-        section_frame.pack(fill=tk.X, padx=self.scaler.scale_padding(20), pady=self.scaler.scale_padding(20))
+        section_frame.pack(fill=tk.X, padx=self._pad[20], pady=self._pad[20])
         
-        label_font = self.theme.get_font("label", scaler=self.scaler)
-        body_font = self.theme.get_font("body", scaler=self.scaler)
-        button_font = self.theme.get_font("button", scaler=self.scaler)
+        label_font = self._fonts["label"]
+        body_font = self._fonts["body"]
+        button_font = self._fonts["button"]
         
         title = tk.Label(
             section_frame,
@@ -708,7 +792,7 @@ class AccountSettingsPanel:
             fg=text_color,
             anchor="w"
         )
-        title.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(10)))
+        title.pack(fill=tk.X, pady=(0, self._pad[10]))
         
         form_frame = tk.Frame(section_frame, bg=bg_color)
         form_frame.pack(fill=tk.X)
@@ -722,7 +806,7 @@ class AccountSettingsPanel:
             fg=text_secondary,
             anchor="w"
         )
-        username_label.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(5)))
+        username_label.pack(fill=tk.X, pady=(0, self._pad[5]))
         
         username_var = tk.StringVar()
         username_entry = tk.Entry(
@@ -732,10 +816,12 @@ class AccountSettingsPanel:
             bg=input_bg,
             fg=input_text,
             insertbackground=input_text,
-            relief=tk.SOLID,
-            borderwidth=1
+            relief=tk.FLAT,
+            highlightthickness=1,
+            highlightbackground=self._colors["menu_bar"],
+            highlightcolor=self._colors["primary"]
         )
-        username_entry.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(15)), ipady=self.scaler.scale_padding(5))
+        username_entry.pack(fill=tk.X, pady=(0, self._pad[15]), ipady=self._pad[5])
         
         # Password
         password_label = tk.Label(
@@ -746,7 +832,7 @@ class AccountSettingsPanel:
             fg=text_secondary,
             anchor="w"
         )
-        password_label.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(5)))
+        password_label.pack(fill=tk.X, pady=(0, self._pad[5]))
         
         password_var = tk.StringVar()
         password_entry = tk.Entry(
@@ -757,10 +843,12 @@ class AccountSettingsPanel:
             fg=input_text,
             insertbackground=input_text,
             show="*",
-            relief=tk.SOLID,
-            borderwidth=1
+            relief=tk.FLAT,
+            highlightthickness=1,
+            highlightbackground=self._colors["menu_bar"],
+            highlightcolor=self._colors["primary"]
         )
-        password_entry.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(15)), ipady=self.scaler.scale_padding(5))
+        password_entry.pack(fill=tk.X, pady=(0, self._pad[15]), ipady=self._pad[5])
         
         # Confirm Password
         confirm_password_label = tk.Label(
@@ -771,7 +859,7 @@ class AccountSettingsPanel:
             fg=text_secondary,
             anchor="w"
         )
-        confirm_password_label.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(5)))
+        confirm_password_label.pack(fill=tk.X, pady=(0, self._pad[5]))
         
         confirm_password_var = tk.StringVar()
         confirm_password_entry = tk.Entry(
@@ -782,10 +870,12 @@ class AccountSettingsPanel:
             fg=input_text,
             insertbackground=input_text,
             show="*",
-            relief=tk.SOLID,
-            borderwidth=1
+            relief=tk.FLAT,
+            highlightthickness=1,
+            highlightbackground=self._colors["menu_bar"],
+            highlightcolor=self._colors["primary"]
         )
-        confirm_password_entry.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(15)), ipady=self.scaler.scale_padding(5))
+        confirm_password_entry.pack(fill=tk.X, pady=(0, self._pad[15]), ipady=self._pad[5])
         
         # Account Type
         account_type_label = tk.Label(
@@ -796,11 +886,11 @@ class AccountSettingsPanel:
             fg=text_secondary,
             anchor="w"
         )
-        account_type_label.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(5)))
+        account_type_label.pack(fill=tk.X, pady=(0, self._pad[5]))
         
         account_type_var = tk.StringVar(value="basic")
         account_type_frame = tk.Frame(form_frame, bg=bg_color)
-        account_type_frame.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(20)))
+        account_type_frame.pack(fill=tk.X, pady=(0, self._pad[20]))
         
         basic_radio = tk.Radiobutton(
             account_type_frame,
@@ -814,7 +904,7 @@ class AccountSettingsPanel:
             activebackground=bg_color,
             activeforeground=text_color
         )
-        basic_radio.pack(side=tk.LEFT, padx=(0, self.scaler.scale_padding(20)))
+        basic_radio.pack(side=tk.LEFT, padx=(0, self._pad[20]))
         
         admin_radio = tk.Radiobutton(
             account_type_frame,
@@ -835,9 +925,9 @@ class AccountSettingsPanel:
             text="",
             font=label_font,
             bg=bg_color,
-            fg=self.theme.get_color("text_error", "#E74C3C")
+            fg=self._colors["text_error"]
         )
-        status_label.pack(pady=(0, self.scaler.scale_padding(10)))
+        status_label.pack(pady=(0, self._pad[10]))
         
         def create_account():
             username = username_var.get().strip()
@@ -857,30 +947,30 @@ class AccountSettingsPanel:
                 status_label.config(text="Passwords do not match")
                 return
             
-            # Check if account already exists
+            # Check if account already exists - the names from the last load answer
+            # most collisions, and the disk is only asked about names not seen there
             account_dir = self.accounts_dir / username
-            if account_dir.exists():
+            if username in self._account_names or account_dir.exists():
                 status_label.config(text="Username already exists")
                 return
             
-            try:
-                # Create account directory
-                account_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Hash password
-                password_hash = hashlib.sha256(password.encode()).hexdigest()
-                
-                # Save account data
-                account_data = {
-                    "username": username,
-                    "password_hash": password_hash,
-                    "account_type": account_type,
-                    "locked": False
-                }
+            # Hashing the password is slow, so the account is written on the executor
+            # while the form polls for the result
+            create_btn.config(state=tk.DISABLED)
+            future = self._executor.submit(self.save_new_account, account_dir, username, password, account_type)
+            
+            def check_created():
+                if not self.frame.winfo_exists():
+                    return
+                if not future.done():
+                    self.frame.after(50, check_created)
+                    return
                 
-                account_file = account_dir / "account.json"
-                with open(account_file, 'w') as f:
-                    json.dump(account_data, f, indent=2)
+                create_btn.config(state=tk.NORMAL)
+                error = future.exception()
+                if error is not None:
+                    status_label.config(text=f"Error: {str(error)}")
+                    return
                 
                 messagebox.showinfo("Success", f"Account '{username}' created successfully!")
                 
@@ -891,19 +981,10 @@ class AccountSettingsPanel:
                 account_type_var.set("basic")
                 status_label.config(text="")
                 
-                # Refresh accounts list
-                self.refresh_accounts_list(
-                    self.accounts_list_frame.master,
-                    self.theme.get_color("background", "#000000"),
-                    self.theme.get_color("text_primary", "#FFFFFF"),
-                    self.theme.get_color("text_secondary", "#E0E0E0"),
-                    self.theme.get_color("primary", "#9D4EDD"),
-                    self.theme.get_color("menu_bar", "#2D2D2D"),
-                    self.theme.get_color("input_background", "#1A1A1A"),
-                    self.theme.get_color("input_text", "#FFFFFF")
-                )
-            except Exception as e:
-                status_label.config(text=f"Error: {str(e)}")
+                # Only the new account changed, so add its row rather than reloading
+                self.add_account_to_list(future.result())
+            
+            self.frame.after(50, check_created)
         
         create_btn = tk.Button(
             form_frame,
@@ -914,11 +995,46 @@ class AccountSettingsPanel:
             fg=text_color,
             cursor="hand2",
             relief=tk.FLAT,
-            padx=self.scaler.scale_padding(30),
-            pady=self.scaler.scale_padding(10)
+            padx=self._pad[30],
+            pady=self._pad[10]
+        )
+        create_btn.pack(pady=(self._pad[10], 0))
+    
+    def save_new_account(self, account_dir, username, password, account_type):
+        """Create an account's directory and account.json (runs on the executor)
+        
+        Returns the new Account.
+        """
+        account_dir.mkdir(parents=True, exist_ok=True)
+        
+        account_data = {
+            "username": username,
+            "password_hash": hash_password(password),
+            "account_type": account_type,
+            "locked": False
+        }
+        
+        account_file = account_dir / "account.json"
+        write_json(account_file, account_data)
+        return Account(
+            username=username,
+            account_type=account_type,
+            locked=False,
+            account_dir=account_dir,
+            account_file=account_file
         )
-        create_btn.pack(pady=(self.scaler.scale_padding(10), 0))
+    
+    def flush_settings(self):
+        """Save a pending toggle now rather than losing it with the frame"""
+        if self._save_after_id:
+            self.frame.after_cancel(self._save_after_id)
+            self._save_after_id = None
+            self._config["allow_account_creation"] = self.account_creation_var.get()
+            self.save_config(self._config)
     
     def destroy(self):
         """Destroy the panel"""
+        self.flush_settings()
+        # A password save already submitted still finishes
+        self._executor.shutdown(wait=False)
         self.frame.destroy()
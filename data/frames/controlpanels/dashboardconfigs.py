@@ -5,7 +5,14 @@ Linux Gaming Center - Dashboard Configs Panel
 
 import tkinter as tk
 from pathlib import Path
-import json
+import sys
+import bisect
+
+_ROOT = str(Path(__file__).parent.parent.parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+from path_helper import get_config_file_path
+from json_helper import read_json, write_json
 
 
 class DashboardConfigsPanel:
@@ -14,11 +21,30 @@ class DashboardConfigsPanel:
         self.theme = theme
         self.scaler = scaler
         
-        bg_color = self.theme.get_color("background", "#000000")
-        text_color = self.theme.get_color("text_primary", "#FFFFFF")
-        text_secondary = self.theme.get_color("text_secondary", "#E0E0E0")
-        primary_color = self.theme.get_color("primary", "#9D4EDD")
-        menu_bar_color = self.theme.get_color("menu_bar", "#2D2D2D")
+        # Scaled padding for the handful of base sizes the panel uses
+        self._pad = {n: self.scaler.scale_padding(n) for n in (3, 5, 10, 20, 30)}
+        
+        # Theme colors and fonts used throughout the panel, looked up once
+        self._colors = {
+            key: self.theme.get_color(key, default)
+            for key, default in (
+                ("background", "#000000"),
+                ("text_primary", "#FFFFFF"),
+                ("text_secondary", "#E0E0E0"),
+                ("primary", "#9D4EDD"),
+                ("menu_bar", "#2D2D2D"),
+            )
+        }
+        self._fonts = {
+            name: self.theme.get_font(name, scaler=self.scaler)
+            for name in ("heading", "label", "body")
+        }
+        
+        bg_color = self._colors["background"]
+        text_color = self._colors["text_primary"]
+        text_secondary = self._colors["text_secondary"]
+        primary_color = self._colors["primary"]
+        menu_bar_color = self._colors["menu_bar"]
         
         self.frame = tk.Frame(parent, bg=bg_color)
         # Use grid to fill parent completely
@@ -31,11 +57,10 @@ class DashboardConfigsPanel:
         self.frame.grid_columnconfigure(0, weight=1)
         
         # Config file for dashboard settings
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-        from path_helper import get_config_file_path
         self.config_file = get_config_file_path("dashboard_config.json")
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
+        # Pending after() id for the debounced save of a reorder
+        self._save_after_id = None
         
         # Scrollable canvas for content (no visible scrollbar)
         self.canvas = tk.Canvas(self.frame, bg=bg_color, highlightthickness=0)
@@ -43,21 +68,28 @@ class DashboardConfigsPanel:
         
         self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         
-        def configure_scroll_region(event=None):
-            self.canvas.update_idletasks()
+        # Width the canvas window was last stretched to, and whether an update of the
+        # scroll region is already scheduled
+        self._last_canvas_width = None
+        self._scroll_region_pending = False
+        
+        def update_scroll_region():
+            self._scroll_region_pending = False
             bbox = self.canvas.bbox("all")
             if bbox:
                 self.canvas.configure(scrollregion=bbox)
-            # Update canvas window width to match canvas
-            if event:
-                canvas_width = event.width
-                if canvas_width > 0:
-                    self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-            else:
-                self.canvas.update_idletasks()
-                canvas_width = self.canvas.winfo_width()
-                if canvas_width > 1:
-                    self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+            # Keep the canvas window as wide as the canvas. Stretching it resizes the
+            # content area, which fires Configure again - the width check ends that loop.
+            canvas_width = self.canvas.winfo_width()
+            if canvas_width > 1 and canvas_width != self._last_canvas_width:
+                self._last_canvas_width = canvas_width
+                self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+        
+        def configure_scroll_region(event=None):
+            # Coalesce a burst of Configure events into one update
+            if not self._scroll_region_pending:
+                self._scroll_region_pending = True
+                self.canvas.after_idle(update_scroll_region)
         
         self.scrollable_frame.bind("<Configure>", configure_scroll_region)
         self.canvas.bind("<Configure>", configure_scroll_region)
@@ -82,12 +114,6 @@ class DashboardConfigsPanel:
             if self.canvas.yview()[1] < 1.0:
                 self.canvas.yview_scroll(3, "units")
         
-        self.canvas.bind("<MouseWheel>", on_mousewheel)
-        self.scrollable_frame.bind("<MouseWheel>", on_mousewheel)
-        self.canvas.bind("<Button-4>", scroll_up)
-        self.canvas.bind("<Button-5>", scroll_down)
-        self.scrollable_frame.bind("<Button-4>", scroll_up)
-        self.scrollable_frame.bind("<Button-5>", scroll_down)
         
         # Arrow key scrolling
         def on_arrow_key(event):
@@ -107,15 +133,19 @@ class DashboardConfigsPanel:
                 self.canvas.yview_moveto(1)
             return "break"
         
-        self.frame.bind("<KeyPress>", on_arrow_key)
-        self.canvas.bind("<KeyPress>", on_arrow_key)
-        self.scrollable_frame.bind("<KeyPress>", on_arrow_key)
+        # Bind scrolling once on a bindtag shared by the panel and every widget in it
+        # (see join_scroll_tag), so it also works over the list items
+        self._scroll_tag = f"DashboardConfigsScroll{id(self)}"
+        self.frame.bind_class(self._scroll_tag, "<MouseWheel>", on_mousewheel)
+        self.frame.bind_class(self._scroll_tag, "<Button-4>", scroll_up)
+        self.frame.bind_class(self._scroll_tag, "<Button-5>", scroll_down)
+        self.frame.bind_class(self._scroll_tag, "<KeyPress>", on_arrow_key)
         
         self.frame.focus_set()
         self.canvas.focus_set()
         
         # Title
-        heading_font = self.theme.get_font("heading", scaler=self.scaler)
+        heading_font = self._fonts["heading"]
         title_label = tk.Label(
             self.scrollable_frame,
             text="Dashboard Configs",
@@ -123,7 +153,7 @@ class DashboardConfigsPanel:
             bg=bg_color,
             fg=text_color
         )
-        title_label.pack(pady=self.scaler.scale_padding(30))
+        title_label.pack(pady=self._pad[30])
         
         # Load current settings
         self.load_settings()
@@ -131,32 +161,24 @@ class DashboardConfigsPanel:
         # Add Recently Used Sections Order Section
         self.create_recently_used_order_section(self.scrollable_frame, bg_color, text_color, text_secondary, primary_color, menu_bar_color)
         
-        # Force initial canvas width update after a short delay
-        def update_canvas_width():
-            self.canvas.update_idletasks()
-            canvas_width = self.canvas.winfo_width()
-            if canvas_width > 1:
-                self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-                bbox = self.canvas.bbox("all")
-                if bbox:
-                    self.canvas.configure(scrollregion=bbox)
-        
-        # Update canvas scroll region
-        self.canvas.update_idletasks()
-        bbox = self.canvas.bbox("all")
-        if bbox:
-            self.canvas.configure(scrollregion=bbox)
-        
-        # Force update after delays
-        self.parent.after(50, update_canvas_width)
-        self.parent.after(200, update_canvas_width)
+        self.join_scroll_tag(self.frame)
+        
+        # Initial width and scroll region once the panel has been laid out
+        self.parent.after_idle(configure_scroll_region)
+    
+    def join_scroll_tag(self, widget):
+        """Add the scrolling bindtag to widget and everything inside it"""
+        widget.bindtags((self._scroll_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self.join_scroll_tag(child)
     
     def load_settings(self):
         """Load dashboard configuration settings"""
+        # Write out a pending reorder first rather than reloading over it
+        self.flush_settings()
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    self.settings = json.load(f)
+                self.settings = read_json(self.config_file)
             except:
                 self.settings = {}
         else:
@@ -169,22 +191,25 @@ class DashboardConfigsPanel:
                 "opensourcegaming",
                 "windowssteam"
             ]
+        
+        # The panel is kept around between visits, so bring the list up to date
+        if hasattr(self, "list_items"):
+            self.sync_list_items()
     
     def save_settings(self):
         """Save dashboard configuration settings"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            write_json(self.config_file, self.settings)
         except Exception as e:
             print(f"Error saving dashboard config: {e}")
     
     def create_recently_used_order_section(self, parent, bg_color, text_color, text_secondary, primary_color, menu_bar_color):
         """Create section for reordering recently used sections"""
         section_frame = tk.Frame(parent, bg=bg_color)
-        section_frame.pack(fill=tk.X, padx=self.scaler.scale_padding(30), pady=self.scaler.scale_padding(20))
+        section_frame.pack(fill=tk.X, padx=self._pad[30], pady=self._pad[20])
         
-        label_font = self.theme.get_font("label", scaler=self.scaler)
-        body_font = self.theme.get_font("body", scaler=self.scaler)
+        label_font = self._fonts["label"]
+        body_font = self._fonts["body"]
         
         title = tk.Label(
             section_frame,
@@ -194,7 +219,7 @@ class DashboardConfigsPanel:
             fg=text_color,
             anchor="w"
         )
-        title.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(10)))
+        title.pack(fill=tk.X, pady=(0, self._pad[10]))
         
         description = tk.Label(
             section_frame,
@@ -205,7 +230,7 @@ class DashboardConfigsPanel:
             anchor="w",
             wraplength=self.scaler.scale_dimension(600)
         )
-        description.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(20)))
+        description.pack(fill=tk.X, pady=(0, self._pad[20]))
         
         # Section names mapping
         self.section_names = {
@@ -216,35 +241,64 @@ class DashboardConfigsPanel:
         
         # List container for draggable items
         list_container = tk.Frame(section_frame, bg=bg_color)
-        list_container.pack(fill=tk.BOTH, expand=True, pady=(0, self.scaler.scale_padding(20)))
+        list_container.pack(fill=tk.BOTH, expand=True, pady=(0, self._pad[20]))
         
         # Create draggable list
-        self.create_draggable_list(list_container, bg_color, text_color, menu_bar_color, primary_color)
+        self.create_draggable_list(list_container)
     
-    def create_draggable_list(self, parent, bg_color, text_color, menu_bar_color, primary_color):
+    def create_draggable_list(self, parent):
         """Create a draggable list of sections"""
         # Container frame for the list
-        list_frame = tk.Frame(parent, bg=bg_color, relief=tk.SOLID, borderwidth=1)
-        list_frame.pack(fill=tk.BOTH, expand=True, padx=self.scaler.scale_padding(10), pady=self.scaler.scale_padding(10))
+        self.list_frame = tk.Frame(parent, bg=self._colors["background"], highlightthickness=1,
+                                   highlightbackground=self._colors["menu_bar"])
+        self.list_frame.pack(fill=tk.BOTH, expand=True, padx=self._pad[10], pady=self._pad[10])
         
-        # Store list items
+        # Store list items, plus every item ever built keyed by section so a
+        # changed order reuses them (see sync_list_items)
         self.list_items = []
+        self._items_by_key = {}
         self.drag_start_index = None
         self.drag_item = None
+        self.drag_centers = []
+        self.drag_indexes = []
         
         # Create items based on current order
+        for section_key in self.get_section_order():
+            self.add_list_item(self.list_frame, section_key)
+    
+    def get_section_order(self):
+        """Get the known sections in their saved order"""
         current_order = self.settings.get("recently_used_order", ["apps", "opensourcegaming", "windowssteam"])
+        return [section_key for section_key in current_order if section_key in self.section_names]
+    
+    def sync_list_items(self):
+        """Show the list in the saved order, reusing the items already built"""
+        order = self.get_section_order()
+        if order == [item.section_key for item in self.list_items]:
+            return
         
-        for section_key in current_order:
-            if section_key in self.section_names:
-                self.add_list_item(list_frame, section_key, bg_color, text_color, menu_bar_color, primary_color)
+        for item in self.list_items:
+            item.pack_forget()
+        self.list_items = []
+        for section_key in order:
+            item_frame = self._items_by_key.get(section_key)
+            if item_frame is None:
+                item_frame = self.add_list_item(self.list_frame, section_key)
+                self.join_scroll_tag(item_frame)
+            else:
+                item_frame.list_index = len(self.list_items)
+                item_frame.pack(fill=tk.X, padx=self._pad[5], pady=self._pad[3])
+                self.list_items.append(item_frame)
     
-    def add_list_item(self, parent, section_key, bg_color, text_color, menu_bar_color, primary_color):
-        """Add a draggable item to the list"""
-        body_font = self.theme.get_font("body", scaler=self.scaler)
+    def add_list_item(self, parent, section_key):
+        """Add a draggable item to the end of the list and return it"""
+        body_font = self._fonts["body"]
+        text_color = self._colors["text_primary"]
+        menu_bar_color = self._colors["menu_bar"]
         
-        item_frame = tk.Frame(parent, bg=menu_bar_color, relief=tk.RAISED, borderwidth=1)
-        item_frame.pack(fill=tk.X, padx=self.scaler.scale_padding(5), pady=self.scaler.scale_padding(3))
+        item_frame = tk.Frame(parent, bg=menu_bar_color, highlightthickness=1,
+                              highlightbackground=self._colors["background"])
+        item_frame.pack(fill=tk.X, padx=self._pad[5], pady=self._pad[3])
         
         # Drag handle (left side)
         handle_label = tk.Label(
@@ -256,7 +310,7 @@ class DashboardConfigsPanel:
             cursor="hand2",
             width=3
         )
-        handle_label.pack(side=tk.LEFT, padx=self.scaler.scale_padding(5))
+        handle_label.pack(side=tk.LEFT, padx=self._pad[5])
         
         # Section name
         name_label = tk.Label(
@@ -267,110 +321,121 @@ class DashboardConfigsPanel:
             fg=text_color,
             anchor="w"
         )
-        name_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=self.scaler.scale_padding(10))
+        name_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=self._pad[10])
         
-        # Store section key in the frame
+        # Store section key and list position in the frame
         item_frame.section_key = section_key
+        item_frame.list_index = len(self.list_items)
         
-        # Bind mouse events for dragging
-        def on_button_press(event):
-            self.drag_start_index = None
-            self.drag_item = item_frame
-            # Find the index of this item
-            for i, item in enumerate(self.list_items):
-                if item == item_frame:
-                    self.drag_start_index = i
-                    break
-            # Visual feedback - highlight the item being dragged
-            item_frame.config(bg=primary_color)
-            handle_label.config(bg=primary_color)
-            name_label.config(bg=primary_color)
-            # Change cursor
-            handle_label.config(cursor="hand2")
-            name_label.config(cursor="hand2")
-            # Store initial y position
-            item_frame.drag_start_y = event.y_root
-        
-        def on_button_release(event):
-            if self.drag_item and self.drag_start_index is not None and self.drag_item == item_frame:
-                # Find drop position based on mouse position
-                drop_y = event.y_root
-                drop_index = None
-                
-                # Check each item to find where to drop
+        item_frame.handle_label = handle_label
+        item_frame.name_label = name_label
+        
+        # Bind mouse events for dragging to the row and both labels; the handlers
+        # are shared by every row and find the row from the event's widget
+        for widget in (handle_label, name_label, item_frame):
+            widget.bind("<Button-1>", self.on_drag_press)
+            widget.bind("<B1-Motion>", self.on_drag_motion)
+            widget.bind("<ButtonRelease-1>", self.on_drag_release)
+            widget.bind("<Leave>", self.on_drag_leave)
+        
+        # Add to list
+        self.list_items.append(item_frame)
+        self._items_by_key[section_key] = item_frame
+        return item_frame
+    
+    def item_from_event(self, event):
+        """Get the list item an event happened on (the row or one of its labels)"""
+        widget = event.widget
+        return widget if hasattr(widget, "section_key") else widget.master
+    
+    def set_item_color(self, item_frame, color):
+        """Set the background of a list item and its labels"""
+        item_frame.config(bg=color)
+        item_frame.handle_label.config(bg=color)
+        item_frame.name_label.config(bg=color)
+    
+    def on_drag_press(self, event):
+        item_frame = self.item_from_event(event)
+        self.drag_item = item_frame
+        self.drag_start_index = item_frame.list_index
+        # Measure the other items once now rather than on release: their vertical
+        # centers (top to bottom) and list indexes, for a bisect on drop
+        self.drag_centers = []
+        self.drag_indexes = []
+        for i, item in enumerate(self.list_items):
+            if item is not item_frame:
+                self.drag_centers.append(item.winfo_rooty() + item.winfo_height() / 2)
+                self.drag_indexes.append(i)
+        # Visual feedback - highlight the item being dragged and raise it
+        self.set_item_color(item_frame, self._colors["primary"])
+        item_frame.config(relief=tk.RAISED, borderwidth=1)
+        # Change cursor
+        item_frame.handle_label.config(cursor="hand2")
+        item_frame.name_label.config(cursor="hand2")
+        # Store initial y position
+        item_frame.drag_start_y = event.y_root
+    
+    def on_drag_release(self, event):
+        item_frame = self.item_from_event(event)
+        if self.drag_item and self.drag_start_index is not None and self.drag_item == item_frame:
+            # Drop before the first item whose center is below the mouse
+            position = bisect.bisect_right(self.drag_centers, event.y_root)
+            if position < len(self.drag_indexes):
+                drop_index = self.drag_indexes[position]
+            else:
+                drop_index = len(self.list_items)
+            
+            # Only move if position changed
+            if drop_index != self.drag_start_index:
+                # Remove from old position
+                self.list_items.pop(self.drag_start_index)
+                # Insert at new position (adjust if needed)
+                if drop_index > self.drag_start_index:
+                    drop_index -= 1
+                self.list_items.insert(drop_index, item_frame)
                 for i, item in enumerate(self.list_items):
-                    if item == item_frame:
-                        continue
-                    item_y = item.winfo_rooty()
-                    item_height = item.winfo_height()
-                    item_center = item_y + item_height / 2
-                    
-                    if drop_y < item_center:
-                        drop_index = i
-                        break
+                    item.list_index = i
                 
-                if drop_index is None:
-                    drop_index = len(self.list_items)
+                # Reorder in parent once the release has been handled, so the
+                # relayout happens in the same idle pass as the highlight reset
+                self.frame.after_idle(self.repack_item, item_frame)
                 
-                # Only move if position changed
-                if drop_index != self.drag_start_index:
-                    # Remove from old position
-                    self.list_items.pop(self.drag_start_index)
-                    # Insert at new position (adjust if needed)
-                    if drop_index > self.drag_start_index:
-                        drop_index -= 1
-                    self.list_items.insert(drop_index, item_frame)
-                    
-                    # Reorder in parent
-                    for item in self.list_items:
-                        item.pack_forget()
-                    for item in self.list_items:
-                        item.pack(fill=tk.X, padx=self.scaler.scale_padding(5), pady=self.scaler.scale_padding(3))
-                    
-                    # Update settings
-                    self.update_order_from_list()
-            
-            # Reset visual feedback
-            if self.drag_item == item_frame:
-                item_frame.config(bg=menu_bar_color)
-                handle_label.config(bg=menu_bar_color)
-                name_label.config(bg=menu_bar_color)
-            
-            self.drag_item = None
-            self.drag_start_index = None
-        
-        def on_motion(event):
-            if self.drag_item and self.drag_start_index is not None and self.drag_item == item_frame:
-                # Visual feedback - keep highlighted
-                item_frame.config(bg=primary_color)
-                handle_label.config(bg=primary_color)
-                name_label.config(bg=primary_color)
-        
-        def on_leave(event):
-            # Only reset if not currently dragging this item
-            if self.drag_item != item_frame:
-                item_frame.config(bg=menu_bar_color)
-                handle_label.config(bg=menu_bar_color)
-                name_label.config(bg=menu_bar_color)
-        
-        # Bind events to both handle and name label
-        handle_label.bind("<Button-1>", on_button_press)
-        handle_label.bind("<B1-Motion>", on_motion)
-        handle_label.bind("<ButtonRelease-1>", on_button_release)
-        handle_label.bind("<Leave>", on_leave)
-        
-        name_label.bind("<Button-1>", on_button_press)
-        name_label.bind("<B1-Motion>", on_motion)
-        name_label.bind("<ButtonRelease-1>", on_button_release)
-        name_label.bind("<Leave>", on_leave)
-        
-        item_frame.bind("<Button-1>", on_button_press)
-        item_frame.bind("<B1-Motion>", on_motion)
-        item_frame.bind("<ButtonRelease-1>", on_button_release)
-        item_frame.bind("<Leave>", on_leave)
+                # Update settings
+                self.update_order_from_list()
         
-        # Add to list
-        self.list_items.append(item_frame)
+        # Reset visual feedback
+        if self.drag_item == item_frame:
+            self.set_item_color(item_frame, self._colors["menu_bar"])
+            item_frame.config(relief=tk.FLAT, borderwidth=0)
+        
+        self.drag_item = None
+        self.drag_start_index = None
+    
+    def on_drag_motion(self, event):
+        item_frame = self.item_from_event(event)
+        if self.drag_item and self.drag_start_index is not None and self.drag_item == item_frame:
+            # Visual feedback - keep highlighted
+            self.set_item_color(item_frame, self._colors["primary"])
+    
+    def on_drag_leave(self, event):
+        item_frame = self.item_from_event(event)
+        # Only reset if not currently dragging this item
+        if self.drag_item != item_frame:
+            self.set_item_color(item_frame, self._colors["menu_bar"])
+    
+    def repack_item(self, item_frame):
+        """Move item_frame to its place in self.list_items
+        
+        Only the dragged item moves, so it is repacked next to its new neighbour
+        instead of unpacking and repacking the whole list.
+        """
+        if not item_frame.winfo_exists() or item_frame not in self.list_items:
+            return
+        index = self.list_items.index(item_frame)
+        if index + 1 < len(self.list_items):
+            item_frame.pack_configure(before=self.list_items[index + 1])
+        elif index > 0:
+            item_frame.pack_configure(after=self.list_items[index - 1])
     
     def update_order_from_list(self):
         """Update settings with current list order"""
@@ -380,8 +445,20 @@ class DashboardConfigsPanel:
                 new_order.append(item.section_key)
         
         self.settings["recently_used_order"] = new_order
-        self.save_settings()
+        
+        # Several reorders in a row are saved once, 300ms after the last one
+        if self._save_after_id:
+            self.frame.after_cancel(self._save_after_id)
+        self._save_after_id = self.frame.after(300, self.flush_settings)
+    
+    def flush_settings(self):
+        """Save a pending reorder now"""
+        if self._save_after_id:
+            self.frame.after_cancel(self._save_after_id)
+            self._save_after_id = None
+            self.save_settings()
     
     def destroy(self):
         """Destroy the panel"""
+        self.flush_settings()
         self.frame.destroy()
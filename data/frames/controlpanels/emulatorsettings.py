@@ -5,7 +5,13 @@ Linux Gaming Center - Emulator Settings Panel
 
 import tkinter as tk
 from pathlib import Path
-import json
+import sys
+
+_ROOT = str(Path(__file__).parent.parent.parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+from path_helper import get_config_file_path
+from config_store import get_config, save_config
 
 
 class EmulatorSettingsPanel:
@@ -14,6 +20,14 @@ class EmulatorSettingsPanel:
         self.theme = theme
         self.scaler = scaler
         
+        # Scaled sizes and theme fonts used throughout the panel, computed once
+        self._pad = {n: self.scaler.scale_padding(n) for n in (10, 20, 30)}
+        self._wraplength = self.scaler.scale_dimension(600)
+        self._fonts = {
+            name: self.theme.get_font(name, scaler=self.scaler)
+            for name in ("heading", "label", "body")
+        }
+        
         bg_color = self.theme.get_color("background", "#000000")
         text_color = self.theme.get_color("text_primary", "#FFFFFF")
         text_secondary = self.theme.get_color("text_secondary", "#E0E0E0")
@@ -30,33 +44,40 @@ class EmulatorSettingsPanel:
         self.frame.grid_columnconfigure(0, weight=1)
         
         # Config file for emulator settings
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-        from path_helper import get_config_file_path
         self.config_file = get_config_file_path("library_config.json")
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # Pending debounced save (see schedule_save)
+        self._save_after_id = None
+        
         # Scrollable canvas for content (no visible scrollbar)
         self.canvas = tk.Canvas(self.frame, bg=bg_color, highlightthickness=0)
         self.scrollable_frame = tk.Frame(self.canvas, bg=bg_color)
         
         self.canvas_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         
-        def configure_scroll_region(event=None):
-            self.canvas.update_idletasks()
+        # Width the canvas window was last stretched to, and whether an update of the
+        # scroll region is already scheduled
+        self._last_canvas_width = None
+        self._scroll_region_pending = False
+        
+        def update_scroll_region():
+            self._scroll_region_pending = False
             bbox = self.canvas.bbox("all")
             if bbox:
                 self.canvas.configure(scrollregion=bbox)
-            # Update canvas window width to match canvas
-            if event:
-                canvas_width = event.width
-                if canvas_width > 0:
-                    self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-            else:
-                self.canvas.update_idletasks()
-                canvas_width = self.canvas.winfo_width()
-                if canvas_width > 1:
-                    self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+            # Keep the canvas window as wide as the canvas. Stretching it resizes the
+            # content area, which fires Configure again - the width check ends that loop.
+            canvas_width = self.canvas.winfo_width()
+            if canvas_width > 1 and canvas_width != self._last_canvas_width:
+                self._last_canvas_width = canvas_width
+                self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+        
+        def configure_scroll_region(event=None):
+            # Coalesce a burst of Configure events into one update
+            if not self._scroll_region_pending:
+                self._scroll_region_pending = True
+                self.canvas.after_idle(update_scroll_region)
         
         self.scrollable_frame.bind("<Configure>", configure_scroll_region)
         self.canvas.bind("<Configure>", configure_scroll_region)
@@ -66,20 +87,35 @@ class EmulatorSettingsPanel:
         self.frame.grid_rowconfigure(0, weight=1)
         self.frame.grid_columnconfigure(0, weight=1)
         
-        # Mouse wheel scrolling
+        # Mouse wheel scrolling - ticks are added up and scrolled once per idle
+        # pass, so a burst of events from a touchpad scrolls the canvas once
+        self._pending_scroll = 0
+        self._scroll_after_id = None
+        
+        def flush_scroll():
+            self._scroll_after_id = None
+            scroll_amount = self._pending_scroll
+            self._pending_scroll = 0
+            if scroll_amount and self.canvas.winfo_exists():
+                self.canvas.yview_scroll(scroll_amount, "units")
+        
+        def queue_scroll(scroll_amount):
+            self._pending_scroll += scroll_amount
+            if self._scroll_after_id is None:
+                self._scroll_after_id = self.canvas.after_idle(flush_scroll)
+        
         def on_mousewheel(event):
             if event.delta:
-                scroll_amount = int(-1 * (event.delta / 40))
-                self.canvas.yview_scroll(scroll_amount, "units")
+                queue_scroll(int(-1 * (event.delta / 40)))
             return "break"
         
         def scroll_up(e):
             if self.canvas.yview()[0] > 0.0:
-                self.canvas.yview_scroll(-3, "units")
+                queue_scroll(-3)
         
         def scroll_down(e):
             if self.canvas.yview()[1] < 1.0:
-                self.canvas.yview_scroll(3, "units")
+                queue_scroll(3)
         
         self.canvas.bind("<MouseWheel>", on_mousewheel)
         self.scrollable_frame.bind("<MouseWheel>", on_mousewheel)
@@ -114,7 +150,7 @@ class EmulatorSettingsPanel:
         self.canvas.focus_set()
         
         # Title
-        heading_font = self.theme.get_font("heading", scaler=self.scaler)
+        heading_font = self._fonts["heading"]
         title_label = tk.Label(
             self.scrollable_frame,
             text="Emulator Settings",
@@ -122,7 +158,7 @@ class EmulatorSettingsPanel:
             bg=bg_color,
             fg=text_color
         )
-        title_label.pack(pady=self.scaler.scale_padding(30))
+        title_label.pack(pady=self._pad[30])
         
         # Load current settings
         self.load_settings()
@@ -130,36 +166,16 @@ class EmulatorSettingsPanel:
         # Add Right-Click Menu Visibility Section
         self.create_right_click_menu_section(self.scrollable_frame, bg_color, text_color, text_secondary, primary_color)
         
-        # Force initial canvas width update after a short delay
-        def update_canvas_width():
-            self.canvas.update_idletasks()
-            canvas_width = self.canvas.winfo_width()
-            if canvas_width > 1:
-                self.canvas.itemconfig(self.canvas_window, width=canvas_width)
-                bbox = self.canvas.bbox("all")
-                if bbox:
-                    self.canvas.configure(scrollregion=bbox)
-        
-        # Update canvas scroll region
-        self.canvas.update_idletasks()
-        bbox = self.canvas.bbox("all")
-        if bbox:
-            self.canvas.configure(scrollregion=bbox)
-        
-        # Force update after delays
-        self.parent.after(50, update_canvas_width)
-        self.parent.after(200, update_canvas_width)
+        # Initial width and scroll region once the panel has been laid out
+        self.parent.after_idle(configure_scroll_region)
     
     def load_settings(self):
         """Load emulator configuration settings"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    self.settings = json.load(f)
-            except:
-                self.settings = {}
-        else:
-            self.settings = {}
+        # Write out a pending toggle first rather than reloading over it
+        self.flush_settings()
+        
+        # Shared with the other panels using library_config.json
+        self.settings = get_config(self.config_file)
         
         # Set defaults if not present
         if "show_emulator_context_menu" not in self.settings:
@@ -168,18 +184,30 @@ class EmulatorSettingsPanel:
     def save_settings(self):
         """Save emulator configuration settings"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            save_config(self.config_file)
         except Exception as e:
             print(f"Error saving emulator settings: {e}")
     
+    def schedule_save(self):
+        """Save settings 300ms after the last change, so quick toggles are written once"""
+        if self._save_after_id:
+            self.frame.after_cancel(self._save_after_id)
+        self._save_after_id = self.frame.after(300, self.flush_settings)
+    
+    def flush_settings(self):
+        """Save a pending change now"""
+        if self._save_after_id:
+            self.frame.after_cancel(self._save_after_id)
+            self._save_after_id = None
+            self.save_settings()
+    
     def create_right_click_menu_section(self, parent, bg_color, text_color, text_secondary, primary_color):
         """Create section for controlling right-click menu visibility"""
         section_frame = tk.Frame(parent, bg=bg_color)
-        section_frame.pack(fill=tk.X, padx=self.scaler.scale_padding(30), pady=self.scaler.scale_padding(20))
+        section_frame.pack(fill=tk.X, padx=self._pad[30], pady=self._pad[20])
         
-        label_font = self.theme.get_font("label", scaler=self.scaler)
-        body_font = self.theme.get_font("body", scaler=self.scaler)
+        label_font = self._fonts["label"]
+        body_font = self._fonts["body"]
         
         title = tk.Label(
             section_frame,
@@ -189,7 +217,7 @@ class EmulatorSettingsPanel:
             fg=text_color,
             anchor="w"
         )
-        title.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(20)))
+        title.pack(fill=tk.X, pady=(0, self._pad[20]))
         
         description = tk.Label(
             section_frame,
@@ -198,13 +226,13 @@ class EmulatorSettingsPanel:
             bg=bg_color,
             fg=text_secondary,
             anchor="w",
-            wraplength=self.scaler.scale_dimension(600)
+            wraplength=self._wraplength
         )
-        description.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(20)))
+        description.pack(fill=tk.X, pady=(0, self._pad[20]))
         
         # Right-click menu visibility toggle
         toggle_frame = tk.Frame(section_frame, bg=bg_color)
-        toggle_frame.pack(fill=tk.X, pady=self.scaler.scale_padding(10))
+        toggle_frame.pack(fill=tk.X, pady=self._pad[10])
         
         label = tk.Label(
             toggle_frame,
@@ -220,7 +248,7 @@ class EmulatorSettingsPanel:
         
         def toggle_callback():
             self.settings["show_emulator_context_menu"] = var.get()
-            self.save_settings()
+            self.schedule_save()
         
         toggle = tk.Checkbutton(
             toggle_frame,
@@ -237,15 +265,15 @@ class EmulatorSettingsPanel:
             offvalue=False
         )
         
-        # Update text when toggled
+        # Update text when toggled (toggle_callback, run by the Checkbutton, saves)
         def update_text():
             toggle.config(text="Enabled" if var.get() else "Disabled")
-            toggle_callback()
         
         var.trace('w', lambda *args: update_text())
         toggle.pack(side=tk.RIGHT)
     
     def destroy(self):
         """Destroy the panel"""
+        self.flush_settings()
         self.frame.destroy()
 
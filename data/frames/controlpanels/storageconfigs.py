@@ -4,13 +4,65 @@ Linux Gaming Center - Storage Configs Panel
 """
 
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
 import json
 import os
 import shutil
 import sys
 import subprocess
+import concurrent.futures
+
+
+# Thumbnail/cache files that are regenerated on demand and never worth migrating
+_SKIPPED_NAMES = frozenset((".cache", "Thumbs.db", ".DS_Store"))
+
+
+# Directory layout created under a new main storage location
+_MAIN_LOCATION_DIRS = (
+    "accounts",
+    "data/apps",
+    "data/emulators",
+    "data/opensourcegaming",
+    "data/windowssteam",
+    "roms",
+    "bios",
+)
+
+# ROM and BIOS folders are never migrated automatically (see the migration dialog)
+_MANUAL_MIGRATION_DIRS = ("roms", "bios")
+
+# Folders under the main location that are migrated on their own, not as config
+_SEPARATE_MIGRATION_DIRS = ("accounts",) + _MANUAL_MIGRATION_DIRS
+
+# storage_config.json always stays in ~/.config/linux-gaming-center
+_PINNED_FILES = ("storage_config.json",)
+
+
+def _ignore_skipped(directory, names):
+    """copytree ignore callback that drops cache files at copy time"""
+    return [name for name in names if name in _SKIPPED_NAMES]
+
+
+def _scan_entries(path):
+    """Return a {name: is_dir} mapping of a directory's entries, or None if it doesn't exist
+    
+    A single os.scandir pass gets the entry types from the directory listing itself,
+    so callers don't need a separate exists()/is_dir() stat per item.
+    """
+    try:
+        with os.scandir(path) as entries:
+            # Symlinks are reported as files so they are copied/removed as links, never followed
+            return {entry.name: entry.is_dir(follow_symlinks=False) for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _is_within(path, root):
+    """Check whether path is root itself or somewhere inside it"""
+    path = Path(path).resolve()
+    root = Path(root).resolve()
+    return path == root or root in path.parents
 
 
 class StorageConfigsPanel:
@@ -41,6 +93,9 @@ class StorageConfigsPanel:
         self.config_file = config_dir / "storage_config.json"
         config_dir.mkdir(parents=True, exist_ok=True)
         
+        # Single worker so migrations run off the Tk thread, one at a time
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        
         # Scrollable canvas for content (no visible scrollbar)
         self.canvas = tk.Canvas(self.frame, bg=bg_color, highlightthickness=0)
         self.scrollable_frame = tk.Frame(self.canvas, bg=bg_color)
@@ -478,42 +533,107 @@ class StorageConfigsPanel:
         
         return result["confirmed"]
     
-    def migrate_directory(self, source, destination, exclude_dirs=None):
+    def migrate_directory(self, source, destination, exclude_dirs=None, exclude_files=None):
         """Migrate data from source to destination directory"""
         if exclude_dirs is None:
             exclude_dirs = []
+        if exclude_files is None:
+            exclude_files = []
         
         source = Path(source)
         destination = Path(destination)
         
-        if not source.exists():
+        source_entries = _scan_entries(source)
+        if source_entries is None:
             return True  # Nothing to migrate
         
-        try:
-            # Create destination if it doesn't exist
-            destination.mkdir(parents=True, exist_ok=True)
+        # Create destination if it doesn't exist
+        destination.mkdir(parents=True, exist_ok=True)
+        destination_entries = _scan_entries(destination) or {}
+        
+        # Copy all contents except excluded directories/files
+        # Errors propagate to the caller - this runs on the migration worker thread
+        for name, is_dir in source_entries.items():
+            if name in exclude_dirs or name in exclude_files:
+                continue
+            if name in _SKIPPED_NAMES:
+                continue
             
-            # Copy all contents except excluded directories
-            for item in source.iterdir():
-                if item.name in exclude_dirs:
-                    continue
-                
-                dest_item = destination / item.name
-                
-                if item.is_dir():
-                    if dest_item.exists():
-                        # Merge directories
-                        self.migrate_directory(item, dest_item)
-                    else:
-                        shutil.copytree(item, dest_item)
-                else:
-                    shutil.copy2(item, dest_item)
+            item = source / name
+            dest_item = destination / name
             
-            return True
-        except Exception as e:
-            print(f"Migration error: {e}")
-            messagebox.showerror("Migration Error", f"Failed to migrate data:\n{str(e)}")
-            return False
+            if is_dir:
+                if name in destination_entries:
+                    # Merge directories
+                    self.migrate_directory(item, dest_item)
+                else:
+                    shutil.copytree(item, dest_item, symlinks=True, ignore=_ignore_skipped)
+            else:
+                shutil.copy2(item, dest_item, follow_symlinks=False)
+        
+        return True
+    
+    def run_migration(self, work, error_message, on_success):
+        """Run a migration on the worker thread with a progress dialog
+        
+        work runs off the Tk thread and must not touch any widgets.
+        on_success runs back on the Tk thread once work finishes.
+        """
+        bg_color = self.theme.get_color("background", "#1A1A2E")
+        text_color = self.theme.get_color("text_primary", "#FFFFFF")
+        
+        dialog = tk.Toplevel(self.parent)
+        dialog.title("Migrating")
+        dialog.configure(bg=bg_color)
+        dialog.transient(self.parent)
+        dialog.grab_set()
+        # Closing the dialog mid-copy would leave the data half migrated
+        dialog.protocol("WM_DELETE_WINDOW", lambda: None)
+        
+        dialog_width = 500
+        dialog_height = 180
+        root = self.parent.winfo_toplevel()
+        x = root.winfo_x() + (root.winfo_width() - dialog_width) // 2
+        y = root.winfo_y() + (root.winfo_height() - dialog_height) // 2
+        dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+        dialog.resizable(False, False)
+        
+        body_font = self.theme.get_font("body", scaler=self.scaler)
+        tk.Label(
+            dialog,
+            text="Migrating data, please wait...",
+            font=body_font,
+            bg=bg_color,
+            fg=text_color
+        ).pack(pady=(self.scaler.scale_padding(30), self.scaler.scale_padding(20)))
+        
+        progress = ttk.Progressbar(dialog, mode="indeterminate", length=400)
+        progress.pack(padx=30)
+        progress.start(10)
+        
+        future = self._executor.submit(work)
+        self.parent.after(150, self._poll_migration, future, dialog, progress, error_message, on_success)
+    
+    def _poll_migration(self, future, dialog, progress, error_message, on_success):
+        """Check on a running migration, rescheduling until it finishes"""
+        # The panel was closed - nothing left to report the result to
+        if not self.frame.winfo_exists():
+            return
+        if not future.done():
+            self.parent.after(150, self._poll_migration, future, dialog, progress, error_message, on_success)
+            return
+        
+        progress.stop()
+        dialog.grab_release()
+        dialog.destroy()
+        
+        error = future.exception()
+        if error is not None:
+            print(f"Migration error: {error}")
+            messagebox.showerror("Migration Error", f"{error_message}:\n{str(error)}")
+            return
+        
+        on_success()
     
     def safely_delete_old_data(self, path, exclude_files=None, exclude_dirs=None, preserve_directory=False):
         """Safely delete old data after migration, preserving excluded files/dirs
@@ -531,7 +651,8 @@ class StorageConfigsPanel:
         
         path = Path(path)
         
-        if not path.exists():
+        entries = _scan_entries(path)
+        if entries is None:
             return True
         
         # Never delete the default config directory - storage_config.json must always live there
@@ -541,20 +662,21 @@ class StorageConfigsPanel:
         
         try:
             # Delete contents of the directory, respecting exclusions
-            for item in path.iterdir():
-                if item.name in exclude_files or item.name in exclude_dirs:
+            kept = False
+            for name, is_dir in entries.items():
+                if name in exclude_files or name in exclude_dirs:
+                    kept = True
                     continue
                 
-                if item.is_dir():
+                item = path / name
+                if is_dir:
                     shutil.rmtree(item)
                 else:
                     item.unlink()
             
             # If directory is now empty and we're allowed to delete it, remove it
-            if not preserve_directory:
-                remaining = list(path.iterdir())
-                if not remaining:
-                    path.rmdir()
+            if not preserve_directory and not kept:
+                path.rmdir()
             
             return True
         except Exception as e:
@@ -808,6 +930,14 @@ class StorageConfigsPanel:
         # New paths
         new_main_path = selected_path / "linux-gaming-center"
         
+        # Copying a tree into itself would never finish
+        if _is_within(new_main_path, old_main_path):
+            messagebox.showerror(
+                "Invalid Location",
+                "The new storage location cannot be inside the current storage location."
+            )
+            return
+        
         message = (
             "Changing the main storage location will migrate your data to the new location.\n\n"
             "The following data will be migrated automatically:\n"
@@ -823,73 +953,57 @@ class StorageConfigsPanel:
             "The application will restart after migration completes."
         )
         
+        def migrate():
+            # Create new directory structure
+            for relative_dir in _MAIN_LOCATION_DIRS:
+                (new_main_path / relative_dir).mkdir(parents=True, exist_ok=True)
+            
+            # Migrate main config files (excluding storage_config.json which stays in ~/.config)
+            # Accounts, ROMs and BIOS are handled separately
+            self.migrate_directory(
+                old_main_path,
+                new_main_path,
+                exclude_dirs=_SEPARATE_MIGRATION_DIRS,
+                exclude_files=_PINNED_FILES
+            )
+            
+            # Migrate accounts (unless custom accounts location is set)
+            if not self.settings.get("custom_accounts_location"):
+                if old_accounts_path.exists():
+                    new_accounts_path = new_main_path / "accounts"
+                    self.migrate_directory(old_accounts_path, new_accounts_path)
+            
+            # Migrate data directory
+            if old_data_path.exists():
+                new_data_path = new_main_path / "data"
+                self.migrate_directory(old_data_path, new_data_path)
+            
+            # Update settings FIRST before deleting old data
+            # This ensures storage_config.json exists before any deletion
+            self.settings[setting_key] = str(selected_path)
+            self.save_settings()
+            
+            # Safely delete old data after successful migration
+            # Keep storage_config.json in the default config location
+            # preserve_directory=True ensures ~/.config/linux-gaming-center is never deleted
+            if old_main_path.exists():
+                self.safely_delete_old_data(
+                    old_main_path,
+                    exclude_files=_PINNED_FILES,
+                    exclude_dirs=_MANUAL_MIGRATION_DIRS,  # Don't delete these - user may not have migrated yet
+                    preserve_directory=True  # Never delete the config directory itself
+                )
+            
+            # Delete old data path if it's separate from main path
+            if old_data_path.exists() and old_data_path != old_main_path / "data":
+                self.safely_delete_old_data(old_data_path)
+        
+        def on_migrated():
+            path_var.set(str(selected_path))
+            self.restart_application()
+        
         def do_migration():
-            try:
-                # Create new directory structure
-                new_main_path.mkdir(parents=True, exist_ok=True)
-                (new_main_path / "accounts").mkdir(parents=True, exist_ok=True)
-                (new_main_path / "data").mkdir(parents=True, exist_ok=True)
-                (new_main_path / "data" / "apps").mkdir(parents=True, exist_ok=True)
-                (new_main_path / "data" / "emulators").mkdir(parents=True, exist_ok=True)
-                (new_main_path / "data" / "opensourcegaming").mkdir(parents=True, exist_ok=True)
-                (new_main_path / "data" / "windowssteam").mkdir(parents=True, exist_ok=True)
-                (new_main_path / "roms").mkdir(parents=True, exist_ok=True)
-                (new_main_path / "bios").mkdir(parents=True, exist_ok=True)
-                
-                # Migrate main config files (excluding storage_config.json which stays in ~/.config)
-                if old_main_path.exists():
-                    for item in old_main_path.iterdir():
-                        if item.name in ["accounts", "roms", "bios"]:
-                            continue  # Handle separately
-                        if item.name == "storage_config.json":
-                            continue  # Keep storage config in default location
-                        
-                        dest_item = new_main_path / item.name
-                        if item.is_dir():
-                            if dest_item.exists():
-                                self.migrate_directory(item, dest_item)
-                            else:
-                                shutil.copytree(item, dest_item)
-                        else:
-                            shutil.copy2(item, dest_item)
-                
-                # Migrate accounts (unless custom accounts location is set)
-                if not self.settings.get("custom_accounts_location"):
-                    if old_accounts_path.exists():
-                        new_accounts_path = new_main_path / "accounts"
-                        self.migrate_directory(old_accounts_path, new_accounts_path)
-                
-                # Migrate data directory
-                if old_data_path.exists():
-                    new_data_path = new_main_path / "data"
-                    self.migrate_directory(old_data_path, new_data_path)
-                
-                # Update settings FIRST before deleting old data
-                # This ensures storage_config.json exists before any deletion
-                path_var.set(str(selected_path))
-                self.settings[setting_key] = str(selected_path)
-                self.save_settings()
-                
-                # Safely delete old data after successful migration
-                # Keep storage_config.json in the default config location
-                # preserve_directory=True ensures ~/.config/linux-gaming-center is never deleted
-                if old_main_path.exists():
-                    self.safely_delete_old_data(
-                        old_main_path,
-                        exclude_files=["storage_config.json"],
-                        exclude_dirs=["roms", "bios"],  # Don't delete these - user may not have migrated yet
-                        preserve_directory=True  # Never delete the config directory itself
-                    )
-                
-                # Delete old data path if it's separate from main path
-                if old_data_path.exists() and old_data_path != old_main_path / "data":
-                    self.safely_delete_old_data(old_data_path)
-                
-                # Restart application
-                self.restart_application()
-                
-            except Exception as e:
-                messagebox.showerror("Migration Error", f"Failed to migrate data:\n{str(e)}")
+            self.run_migration(migrate, "Failed to migrate data", on_migrated)
         
         self.show_migration_dialog("Migrate Storage Location", message, do_migration)
     
@@ -897,6 +1011,14 @@ class StorageConfigsPanel:
         """Handle changing the accounts location"""
         old_accounts_path = self.get_current_accounts_path()
         
+        # Copying a tree into itself would never finish
+        if _is_within(selected_path, old_accounts_path):
+            messagebox.showerror(
+                "Invalid Location",
+                "The new accounts location cannot be inside the current accounts location."
+            )
+            return
+        
         message = (
             "Changing the accounts location will migrate all user account data to the new location.\n\n"
             "The following data will be migrated:\n"
@@ -908,29 +1030,28 @@ class StorageConfigsPanel:
             "The application will restart after migration completes."
         )
         
+        def migrate():
+            # Create new directory
+            selected_path.mkdir(parents=True, exist_ok=True)
+            
+            # Migrate accounts
+            if old_accounts_path.exists():
+                self.migrate_directory(old_accounts_path, selected_path)
+            
+            # Update settings FIRST before deleting old data
+            self.settings[setting_key] = str(selected_path)
+            self.save_settings()
+            
+            # Safely delete old accounts folder after successful migration
+            if old_accounts_path.exists():
+                self.safely_delete_old_data(old_accounts_path)
+        
+        def on_migrated():
+            path_var.set(str(selected_path))
+            self.restart_application()
+        
         def do_migration():
-            try:
-                # Create new directory
-                selected_path.mkdir(parents=True, exist_ok=True)
-                
-                # Migrate accounts
-                if old_accounts_path.exists():
-                    self.migrate_directory(old_accounts_path, selected_path)
-                
-                # Update settings FIRST before deleting old data
-                path_var.set(str(selected_path))
-                self.settings[setting_key] = str(selected_path)
-                self.save_settings()
-                
-                # Safely delete old accounts folder after successful migration
-                if old_accounts_path.exists():
-                    self.safely_delete_old_data(old_accounts_path)
-                
-                # Restart application
-                self.restart_application()
-                
-            except Exception as e:
-                messagebox.showerror("Migration Error", f"Failed to migrate accounts:\n{str(e)}")
+            self.run_migration(migrate, "Failed to migrate accounts", on_migrated)
         
         self.show_migration_dialog("Migrate Accounts", message, do_migration)
     
@@ -1010,4 +1131,5 @@ class StorageConfigsPanel:
     
     def destroy(self):
         """Destroy the panel"""
+        self._executor.shutdown(wait=False)
         self.frame.destroy()
@@ -7,7 +7,9 @@ Application store for downloading games and apps
 import tkinter as tk
 from pathlib import Path
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+_ROOT = str(Path(__file__).parent.parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 
 class StoreFrame:
@@ -8,12 +8,16 @@ import tkinter as tk
 from tkinter import messagebox, filedialog
 from pathlib import Path
 import json
-import hashlib
 import shutil
 import os
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from path_helper import get_user_account_dir, get_accounts_path
+from concurrent.futures import ThreadPoolExecutor
+_ROOT = str(Path(__file__).parent.parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+from path_helper import get_user_account_dir
+from password_helper import hash_password, verify_password
+from json_helper import write_json
 
 # Try to import PIL for image handling
 try:
@@ -30,6 +34,8 @@ class UserAccountSettingsFrame:
         self.scaler = scaler
         self.username = username
         self.dashboard = dashboard  # Reference to dashboard for updating profile
+        # Checks and hashes passwords off the Tk thread - scrypt is deliberately slow
+        self._executor = ThreadPoolExecutor(max_workers=1)
         
         bg_color = self.theme.get_color("background", "#000000")
         text_color = self.theme.get_color("text_primary", "#FFFFFF")
@@ -91,10 +97,12 @@ class UserAccountSettingsFrame:
             self.canvas.yview_scroll(3, "units")
             return "break"
         
-        # Store scroll functions for binding to child widgets
-        self._on_mousewheel = on_mousewheel
-        self._scroll_up = scroll_up
-        self._scroll_down = scroll_down
+        # Scroll bindings live on one bind tag that child widgets are given,
+        # instead of binding three handlers on every widget
+        self._scroll_tag = f"AccountSettingsScroll{id(self)}"
+        self.frame.bind_class(self._scroll_tag, "<MouseWheel>", on_mousewheel)
+        self.frame.bind_class(self._scroll_tag, "<Button-4>", scroll_up)
+        self.frame.bind_class(self._scroll_tag, "<Button-5>", scroll_down)
         
         # Bind to canvas and scrollable frame
         self.canvas.bind("<MouseWheel>", on_mousewheel)
@@ -164,11 +172,10 @@ class UserAccountSettingsFrame:
         self.bind_scroll_to_children(self.scrollable_frame)
     
     def bind_scroll_to_children(self, widget):
-        """Recursively bind scroll events to all child widgets"""
-        # Bind mouse wheel events
-        widget.bind("<MouseWheel>", self._on_mousewheel, add="+")
-        widget.bind("<Button-4>", self._scroll_up, add="+")
-        widget.bind("<Button-5>", self._scroll_down, add="+")
+        """Recursively give all child widgets the scroll bind tag"""
+        tags = widget.bindtags()
+        if self._scroll_tag not in tags:
+            widget.bindtags((self._scroll_tag,) + tags)
         
         # Recursively bind to all children
         for child in widget.winfo_children():
@@ -281,8 +288,7 @@ class UserAccountSettingsFrame:
                 
                 # Save account data to new location
                 new_account_file = new_account_dir / "account.json"
-                with open(new_account_file, 'w') as f:
-                    json.dump(account_data, f, indent=2)
+                write_json(new_account_file, account_data)
                 
                 # Copy all files from old directory to new directory
                 if self.account_dir.exists():
@@ -454,29 +460,35 @@ class UserAccountSettingsFrame:
                 status_label.config(text="New passwords do not match", fg=self.theme.get_color("text_error", "#E74C3C"))
                 return
             
-            try:
-                # Load account data
-                if not self.account_file or not self.account_file.exists():
-                    status_label.config(text="Account file not found", fg=self.theme.get_color("text_error", "#E74C3C"))
+            # Load account data
+            if not self.account_file or not self.account_file.exists():
+                status_label.config(text="Account file not found", fg=self.theme.get_color("text_error", "#E74C3C"))
+                return
+            
+            # Checking and hashing passwords is deliberately slow, so it runs on the
+            # executor while the form polls for the result
+            save_btn.config(state=tk.DISABLED)
+            future = self._executor.submit(self.change_password, current_pass, new_pass)
+            
+            def check_changed():
+                if not self.frame.winfo_exists():
+                    return
+                if not future.done():
+                    self.frame.after(50, check_changed)
                     return
                 
-                with open(self.account_file, 'r') as f:
-                    account_data = json.load(f)
+                save_btn.config(state=tk.NORMAL)
+                error = future.exception()
+                if error is not None:
+                    status_label.config(text=f"Error: {str(error)}", fg=self.theme.get_color("text_error", "#E74C3C"))
+                    print(f"Error changing password: {error}")
+                    return
                 
                 # Verify current password
-                current_pass_hash = hashlib.sha256(current_pass.encode()).hexdigest()
-                if account_data.get('password_hash') != current_pass_hash:
+                if not future.result():
                     status_label.config(text="Current password is incorrect", fg=self.theme.get_color("text_error", "#E74C3C"))
                     return
                 
-                # Update password
-                new_pass_hash = hashlib.sha256(new_pass.encode()).hexdigest()
-                account_data['password_hash'] = new_pass_hash
-                
-                # Save account data
-                with open(self.account_file, 'w') as f:
-                    json.dump(account_data, f, indent=2)
-                
                 messagebox.showinfo("Success", "Password changed successfully!")
                 
                 # Clear form
@@ -484,10 +496,8 @@ class UserAccountSettingsFrame:
                 new_pass_var.set("")
                 confirm_pass_var.set("")
                 status_label.config(text="")
-                
-            except Exception as e:
-                status_label.config(text=f"Error: {str(e)}", fg=self.theme.get_color("text_error", "#E74C3C"))
-                print(f"Error changing password: {e}")
+            
+            self.frame.after(50, check_changed)
         
         save_btn = tk.Button(
             form_frame,
@@ -503,6 +513,21 @@ class UserAccountSettingsFrame:
         )
         save_btn.pack(pady=(self.scaler.scale_padding(10), 0))
     
+    def change_password(self, current_pass, new_pass):
+        """Check the current password and save the new one (runs on the executor)
+        
+        Returns False, without saving, if the current password is wrong.
+        """
+        with open(self.account_file, 'r') as f:
+            account_data = json.load(f)
+        
+        if not verify_password(current_pass, account_data.get('password_hash')):
+            return False
+        
+        account_data['password_hash'] = hash_password(new_pass)
+        write_json(self.account_file, account_data)
+        return True
+    
     def create_change_profile_picture_section(self, parent, bg_color, text_color, text_secondary, primary_color):
         """Create section for changing profile picture"""
         section_frame = tk.Frame(parent, bg=bg_color)
@@ -556,8 +581,7 @@ class UserAccountSettingsFrame:
                             profile_image_path = str(potential_path)
                             # Update the account data with the correct path
                             account_data['profile_image'] = profile_image_path
-                            with open(self.account_file, 'w') as f:
-                                json.dump(account_data, f, indent=2)
+                            write_json(self.account_file, account_data)
                             break
                 
                 if profile_image_path and os.path.exists(profile_image_path) and PIL_AVAILABLE:
@@ -660,8 +684,7 @@ class UserAccountSettingsFrame:
                 account_data["profile_image"] = str(new_profile_path)
                 
                 # Save account data
-                with open(self.account_file, 'w') as f:
-                    json.dump(account_data, f, indent=2)
+                write_json(self.account_file, account_data)
                 
                 messagebox.showinfo("Success", "Profile picture updated successfully!")
                 
@@ -738,4 +761,6 @@ class UserAccountSettingsFrame:
     
     def destroy(self):
         """Destroy the panel"""
+        # A password change already submitted still finishes
+        self._executor.shutdown(wait=False)
         self.frame.destroy()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Linux Gaming Center - Image Cache Module
+Keeps resized cover images around so library grids don't re-resample them on every reload
+"""
+
+import importlib.util
+import logging
+from collections import OrderedDict
+from pathlib import Path
+
+# Only check that PIL is installed here - importing it loads its C extension,
+# so that is deferred until an image is actually needed (see _import_pil).
+# Look for ImageTk itself: some distros package Pillow without it
+try:
+    PIL_AVAILABLE = importlib.util.find_spec("PIL.ImageTk") is not None
+except ImportError:
+    PIL_AVAILABLE = False
+Image = None
+ImageTk = None
+
+logger = logging.getLogger(__name__)
+
+
+# Maximum number of resized images kept in memory
+MAX_CACHED_IMAGES = 256
+
+# Resized PIL images keyed by (path, mtime, width, height, resample), least recently used first
+_resized_images = OrderedDict()
+
+# Tk PhotoImages keyed by (path, mtime, width, height), least recently used first
+_photo_images = OrderedDict()
+
+# Files PIL couldn't read, path -> mtime, so broken covers aren't re-opened on every
+# reload. A new mtime (the file was replaced) gets another try.
+_failed_images = {}
+
+
+def _import_pil():
+    """Import PIL on first use"""
+    global Image, ImageTk
+    if Image is None:
+        from PIL import Image as pil_image, ImageTk as pil_imagetk
+        Image, ImageTk = pil_image, pil_imagetk
+
+
+def _load_checked(key, load, *args):
+    """Call load(*args), remembering the file in key as broken if PIL can't read it"""
+    if _failed_images.get(key[0]) == key[1]:
+        raise OSError(f"cannot identify image file {key[0]!r} (failed before)")
+    try:
+        return load(*args)
+    except OSError:
+        _failed_images[key[0]] = key[1]
+        raise
+
+
+def _load_resized(image_path, width, height, resample):
+    """Open an image from disk and resize it"""
+    with Image.open(image_path) as source:
+        # Icons already drawn at the target size only need decoding
+        if source.size == (width, height):
+            return source.copy()
+
+        # JPEGs can be decoded at 1/2, 1/4 or 1/8 scale straight from the file,
+        # which is much cheaper than decoding full size and resampling it all.
+        # Keep 2x the target so the final resample still has detail to work with.
+        if source.format == "JPEG":
+            source.draft("RGB", (width * 2, height * 2))
+        return source.resize((width, height), resample)
+
+
+def _load_fitted(image_path, max_width, max_height):
+    """Open an image from disk and scale it down to fit, keeping its aspect ratio"""
+    with Image.open(image_path) as image:
+        image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+        return image.copy()
+
+
+def get_resized_image(image_path, width, height, resample=None):
+    """Get an image resized to width x height, reusing a cached copy when possible
+
+    The file's modification time is part of the key, so replacing an image on disk
+    is picked up on the next load. resample defaults to LANCZOS; pass BILINEAR for
+    a cheap preview. Raises the usual OSError/PIL errors on failure.
+    """
+    _import_pil()
+    if resample is None:
+        resample = Image.Resampling.LANCZOS
+
+    image_path = Path(image_path)
+    key = (str(image_path), image_path.stat().st_mtime_ns, width, height, resample)
+
+    image = _resized_images.get(key)
+    if image is not None:
+        _resized_images.move_to_end(key)
+        return image
+
+    image = _load_checked(key, _load_resized, image_path, width, height, resample)
+
+    _resized_images[key] = image
+    if len(_resized_images) > MAX_CACHED_IMAGES:
+        _resized_images.popitem(last=False)
+
+    return image
+
+
+def _photo_key(image_path, width, height):
+    return (str(image_path), image_path.stat().st_mtime_ns, width, height)
+
+
+def _store_photo(key, photo):
+    _photo_images[key] = photo
+    if len(_photo_images) > MAX_CACHED_IMAGES:
+        _photo_images.popitem(last=False)
+
+
+def get_photo(image_path, width, height, reuse=None):
+    """Get a Tk PhotoImage of an image resized to width x height, cached
+
+    Building a PhotoImage copies every pixel into Tk, so grids reuse the same
+    PhotoImage for a cover across reloads instead of creating a new one each time.
+    If reuse is an uncached PhotoImage of the same size (e.g. a preview), the image
+    is pasted into it in place rather than allocating another Tk image.
+    """
+    _import_pil()
+    image_path = Path(image_path)
+    key = _photo_key(image_path, width, height)
+
+    photo = _photo_images.get(key)
+    if photo is not None:
+        _photo_images.move_to_end(key)
+        return photo
+
+    image = _load_checked(key, _load_resized, image_path, width, height, Image.Resampling.LANCZOS)
+    if reuse is not None and (reuse.width(), reuse.height()) == image.size:
+        reuse.paste(image)
+        photo = reuse
+    else:
+        photo = ImageTk.PhotoImage(image)
+
+    _store_photo(key, photo)
+    return photo
+
+
+def get_fitted_photo(image_path, max_width, max_height):
+    """Get a PhotoImage of an image scaled down to fit max_width x max_height, cached
+
+    Unlike get_photo the aspect ratio is kept, as with PIL's thumbnail().
+    """
+    _import_pil()
+    image_path = Path(image_path)
+    key = (str(image_path), image_path.stat().st_mtime_ns, "fit", max_width, max_height)
+
+    photo = _photo_images.get(key)
+    if photo is not None:
+        _photo_images.move_to_end(key)
+        return photo
+
+    photo = ImageTk.PhotoImage(_load_checked(key, _load_fitted, image_path, max_width, max_height))
+
+    _store_photo(key, photo)
+    return photo
+
+
+def get_preview_photo(image_path, width, height):
+    """Get a PhotoImage for the first paint of a grid
+
+    Returns (photo, is_final). If the full quality photo is already cached it is
+    returned as final; otherwise a cheap BILINEAR resize is returned and the caller
+    should hand the widget to refine_images once the grid is built.
+    """
+    _import_pil()
+    image_path = Path(image_path)
+    key = _photo_key(image_path, width, height)
+
+    if key in _photo_images:
+        return get_photo(image_path, width, height), True
+
+    # Previews are thrown away once refined, so they don't take a cache slot
+    image = _load_checked(key, _load_resized, image_path, width, height, Image.Resampling.BILINEAR)
+    return ImageTk.PhotoImage(image), False
+
+
+def refine_images(owner, pending, width, height):
+    """Swap BILINEAR previews for LANCZOS images, one widget per idle callback
+
+    pending is a list of (widget, image_path) and owner is a long-lived widget used
+    to schedule the steps. Each step is a 1ms timer so input and redraws are handled
+    between images - an idle callback would be drained by any update_idletasks call.
+    Widgets destroyed by a reload in the meantime are skipped.
+    """
+    if not pending:
+        return
+
+    widget, image_path = pending.pop(0)
+    if widget.winfo_exists():
+        try:
+            # The preview is the same size, so paste the final image into it in place
+            preview = getattr(widget, "image", None)
+            photo = get_photo(image_path, width, height, reuse=preview)
+            if photo is not preview:
+                widget.configure(image=photo)
+                widget.image = photo  # Keep reference
+        except Exception as e:
+            logger.warning("Error refining image %s: %s", image_path, e)
+
+    if pending and owner.winfo_exists():
+        owner.after(1, refine_images, owner, pending, width, height)
+
+
+def clear_image_cache():
+    """Drop all cached images"""
+    _resized_images.clear()
+    _photo_images.clear()
+    _failed_images.clear()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Linux Gaming Center - JSON Helper Module
+Reads and writes settings and account files with orjson when it is installed, stdlib json otherwise
+"""
+
+import json
+import os
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data):
+    """Encode data as indented UTF-8 JSON bytes
+
+    Files keep the two space indent they have always had so they stay readable
+    and diffable by hand; orjson produces the same layout much faster.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def read_json(path):
+    """Read and parse a JSON file"""
+    with open(path, 'rb') as f:
+        payload = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def write_json(path, data):
+    """Write data to path as JSON in a single write call
+
+    The data goes to a temporary file that then replaces path, so a crash
+    mid-write can't leave a truncated file behind.
+    """
+    path = str(path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(dumps_json(data))
+    os.replace(tmp_path, path)
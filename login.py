@@ -4,33 +4,26 @@ Linux Gaming Center - Login Screen
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from pathlib import Path
+from tkinter import filedialog
 import json
-import hashlib
 import shutil
 import os
+from concurrent.futures import ThreadPoolExecutor
 from path_helper import get_accounts_path, get_config_file_path, get_user_account_dir
-
-# Try to import PIL for image handling (optional)
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+from image_cache import PIL_AVAILABLE, get_fitted_photo
+from password_helper import hash_password, verify_password
+from json_helper import write_json
 
 
 def has_any_accounts():
     """Check if any accounts exist in the accounts directory"""
     accounts_dir = get_accounts_path()
     
-    if not accounts_dir.exists():
-        return False
-    
-    # Check if there are any subdirectories (accounts)
+    # Check if there are any subdirectories (accounts) - scandir knows each entry's
+    # type from the listing, and the scan can stop at the first account found
     try:
-        subdirs = [d for d in accounts_dir.iterdir() if d.is_dir()]
-        return len(subdirs) > 0
+        with os.scandir(accounts_dir) as entries:
+            return any(entry.is_dir() for entry in entries)
     except Exception:
         return False
 
@@ -43,6 +36,8 @@ class LoginScreen:
         self.on_exit = on_exit
         self.theme = theme
         self.scaler = scaler
+        # Checks passwords off the Tk thread - scrypt takes tens of ms per check
+        self._executor = ThreadPoolExecutor(max_workers=1)
         
         # Steam-like colors
         bg_color = self.theme.get_color("background", "#1A1A2E")
@@ -67,47 +62,34 @@ class LoginScreen:
         app_root = get_app_root()
         logo_path = app_root / "data" / "themes" / "cosmic-twilight" / "images" / "linuxgamingcenter.png"
         
-        title_label = None
+        # Text title first so the panel shows straight away; the logo replaces it
+        # once the screen has been drawn
+        title_font = self.theme.get_font("heading", scaler=self.scaler)
+        title_label = tk.Label(
+            login_panel,
+            text="Linux Gaming Center",
+            font=title_font,
+            bg=panel_bg,
+            fg=text_color
+        )
+        title_label.pack(pady=(self.scaler.scale_padding(50), self.scaler.scale_padding(10)))
+        
         if logo_path.exists() and PIL_AVAILABLE:
-            try:
-                logo_image = Image.open(logo_path)
-                # Resize logo to reasonable size (keeping aspect ratio)
-                # Calculate size to fit nicely in the login panel (scaled)
-                max_width = self.scaler.scale_dimension(600)
-                max_height = self.scaler.scale_dimension(150)
-                logo_image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_image)
-                
-                title_label = tk.Label(
-                    login_panel,
-                    image=logo_photo,
-                    bg=panel_bg
-                )
-                title_label.image = logo_photo  # Keep reference
-                title_label.pack(pady=(50, 10))
-            except Exception as e:
-                print(f"Error loading logo: {e}")
-                # Fallback to text
-                title_font = self.theme.get_font("heading", scaler=self.scaler)
-                title_label = tk.Label(
-                    login_panel,
-                    text="Linux Gaming Center",
-                    font=title_font,
-                    bg=panel_bg,
-                    fg=text_color
-                )
-                title_label.pack(pady=(self.scaler.scale_padding(50), self.scaler.scale_padding(10)))
-        else:
-            # Fallback to text if image not available
-            title_font = self.theme.get_font("heading", scaler=self.scaler)
-            title_label = tk.Label(
-                login_panel,
-                text="Linux Gaming Center",
-                font=title_font,
-                bg=panel_bg,
-                fg=text_color
-            )
-            title_label.pack(pady=(self.scaler.scale_padding(50), self.scaler.scale_padding(10)))
+            def load_logo():
+                if not title_label.winfo_exists():
+                    return
+                try:
+                    # Resize logo to reasonable size (keeping aspect ratio)
+                    # Calculate size to fit nicely in the login panel (scaled)
+                    max_width = self.scaler.scale_dimension(600)
+                    max_height = self.scaler.scale_dimension(150)
+                    logo_photo = get_fitted_photo(logo_path, max_width, max_height)
+                    title_label.configure(image=logo_photo)
+                    title_label.image = logo_photo  # Keep reference
+                except Exception as e:
+                    print(f"Error loading logo: {e}")
+            
+            title_label.after_idle(load_logo)
         
         subtitle_font = self.theme.get_font("body_small", scaler=self.scaler)
         subtitle_label = tk.Label(
@@ -219,7 +201,7 @@ class LoginScreen:
         # Login button (large, prominent)
         button_font = self.theme.get_font("button", scaler=self.scaler)
         primary_color = self.theme.get_color("primary", "#4CAF50")
-        login_button = tk.Button(
+        self.login_button = tk.Button(
             form_frame,
             text="Sign In",
             font=button_font,
@@ -233,7 +215,7 @@ class LoginScreen:
             borderwidth=0,
             activebackground=self.theme.get_color("primary_hover", "#45a049")
         )
-        login_button.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(15)), ipady=self.scaler.scale_padding(5))
+        self.login_button.pack(fill=tk.X, pady=(0, self.scaler.scale_padding(15)), ipady=self.scaler.scale_padding(5))
         
         # Divider line
         divider = tk.Frame(form_frame, bg=self.theme.get_color("border", "#34495E"), height=1)
@@ -298,27 +280,55 @@ class LoginScreen:
         
         error_color = self.theme.get_color("text_error", "#E74C3C")
         
+        # A check is already running (Return pressed again while waiting)
+        if self.login_button.cget("state") == tk.DISABLED:
+            return
+        
         if not username or not password:
             self.status_label.config(text="Please enter both username and password", fg=error_color)
             return
         
-        if self.verify_credentials(username, password):
-            self.status_label.config(text="", fg=error_color)
-            self.on_login_success(username)
-        else:
+        password_hash = self.get_password_hash(username)
+        if password_hash is None:
             self.status_label.config(text="Invalid username or password", fg=error_color)
             self.password_entry.delete(0, tk.END)
+            return
+        
+        # Checking the password is deliberately slow, so it runs on the executor
+        # while the screen polls for the result
+        self.login_button.config(state=tk.DISABLED)
+        future = self._executor.submit(verify_password, password, password_hash)
+        
+        def check_verified():
+            if not self.frame.winfo_exists():
+                return
+            if not future.done():
+                self.frame.after(50, check_verified)
+                return
+            
+            self.login_button.config(state=tk.NORMAL)
+            if future.exception() is None and future.result():
+                self.status_label.config(text="", fg=error_color)
+                self.on_login_success(username)
+            else:
+                self.status_label.config(text="Invalid username or password", fg=error_color)
+                self.password_entry.delete(0, tk.END)
+        
+        self.frame.after(50, check_verified)
     
-    def verify_credentials(self, username, password):
-        """Verify username and password"""
+    def get_password_hash(self, username):
+        """Get the stored password hash for an account
+        
+        Returns None if the account doesn't exist, can't be read or is locked.
+        """
         account_dir = get_user_account_dir(username)
         
         if not account_dir.exists():
-            return False
+            return None
         
         account_file = account_dir / "account.json"
         if not account_file.exists():
-            return False
+            return None
         
         try:
             with open(account_file, 'r') as f:
@@ -327,14 +337,12 @@ class LoginScreen:
             # Check if account is locked
             if account_data.get('locked', False):
                 self.status_label.config(text="This account is locked by admin", fg=self.theme.get_color("text_error", "#E74C3C"))
-                return False
+                return None
             
-            # Hash the provided password and compare
-            password_hash = hashlib.sha256(password.encode()).hexdigest()
-            return account_data.get('password_hash') == password_hash
+            return account_data.get('password_hash') or ""
         except Exception as e:
             print(f"Error verifying credentials: {e}")
-            return False
+            return None
     
     def create_account(self):
         """Open create account screen"""
@@ -400,6 +408,8 @@ class CreateAccountScreen:
         self.theme = theme
         self.scaler = scaler
         self.profile_image_path = None
+        # Writes new accounts off the Tk thread - hashing the password is slow
+        self._executor = ThreadPoolExecutor(max_workers=1)
         
         bg_color = self.theme.get_color("background", "#1A1A2E")
         self.frame = tk.Frame(parent, bg=bg_color)
@@ -546,7 +556,7 @@ class CreateAccountScreen:
         # Create button
         button_font = self.theme.get_font("button", scaler=self.scaler)
         primary_color = self.theme.get_color("primary", "#4CAF50")
-        create_button = tk.Button(
+        self.create_button = tk.Button(
             self.center_frame,
             text="Create Account",
             font=button_font,
@@ -557,7 +567,7 @@ class CreateAccountScreen:
             fg=text_color,
             cursor="hand2"
         )
-        create_button.pack(pady=(self.scaler.scale_padding(20), self.scaler.scale_padding(15)))
+        self.create_button.pack(pady=(self.scaler.scale_padding(20), self.scaler.scale_padding(15)))
         
         # Cancel button - only show if not creating first account
         self.cancel_button = tk.Button(
@@ -668,38 +678,29 @@ class CreateAccountScreen:
             self.status_label.config(text="Username already exists", fg=error_color)
             return
         
-        try:
-            # Check if this is the first account (administrator) or a basic account
-            is_first_account = not has_any_accounts()
-            account_type = "administrator" if is_first_account else "basic"
-            
-            # Create account directory
-            account_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Hash password
-            password_hash = hashlib.sha256(password.encode()).hexdigest()
-            
-            # Copy profile image if selected
-            profile_image_path = None
-            if self.profile_image_path:
-                image_ext = os.path.splitext(self.profile_image_path)[1]
-                profile_image_dest = account_dir / f"profile{image_ext}"
-                shutil.copy2(self.profile_image_path, profile_image_dest)
-                profile_image_path = str(profile_image_dest)
-            
-            # Save account data
-            account_data = {
-                "username": username,
-                "password_hash": password_hash,
-                "account_type": account_type
-            }
-            
-            if profile_image_path:
-                account_data["profile_image"] = profile_image_path
+        # Check if this is the first account (administrator) or a basic account
+        is_first_account = not has_any_accounts()
+        account_type = "administrator" if is_first_account else "basic"
+        
+        # Hashing the password is slow, so the account is written on the executor
+        # while the screen polls for the result
+        self.create_button.config(state=tk.DISABLED)
+        future = self._executor.submit(
+            self.save_new_account, account_dir, username, password, account_type, self.profile_image_path
+        )
+        
+        def check_created():
+            if not self.frame.winfo_exists():
+                return
+            if not future.done():
+                self.frame.after(50, check_created)
+                return
             
-            account_file = account_dir / "account.json"
-            with open(account_file, 'w') as f:
-                json.dump(account_data, f, indent=2)
+            self.create_button.config(state=tk.NORMAL)
+            error = future.exception()
+            if error is not None:
+                self.status_label.config(text=f"Error: {str(error)}", fg=error_color)
+                return
             
             # Clear fields
             self.username_entry.delete(0, tk.END)
@@ -716,10 +717,37 @@ class CreateAccountScreen:
                 fg=success_color
             )
             self.frame.after(1500, lambda: self.on_account_created(username))
-            
-        except Exception as e:
-            error_color = self.theme.get_color("text_error", "#E74C3C")
-            self.status_label.config(text=f"Error: {str(e)}", fg=error_color)
+        
+        self.frame.after(50, check_created)
+    
+    def save_new_account(self, account_dir, username, password, account_type, image_path):
+        """Create an account's directory, profile image and account.json (runs on the executor)"""
+        # Create account directory
+        account_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Hash password
+        password_hash = hash_password(password)
+        
+        # Copy profile image if selected
+        profile_image_path = None
+        if image_path:
+            image_ext = os.path.splitext(image_path)[1]
+            profile_image_dest = account_dir / f"profile{image_ext}"
+            shutil.copy2(image_path, profile_image_dest)
+            profile_image_path = str(profile_image_dest)
+        
+        # Save account data
+        account_data = {
+            "username": username,
+            "password_hash": password_hash,
+            "account_type": account_type
+        }
+        
+        if profile_image_path:
+            account_data["profile_image"] = profile_image_path
+        
+        account_file = account_dir / "account.json"
+        write_json(account_file, account_data)
     
     def exit_app(self):
         """Exit the application without creating an account"""
@@ -5,7 +5,6 @@ Linux Gaming Center - Main Application Entry Point
 
 import tkinter as tk
 from pathlib import Path
-import os
 import sys
 
 # Get absolute path to app root directory (linux-gaming-center)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Linux Gaming Center - Password Helper Module
+Hashes account passwords with salted scrypt and verifies both scrypt and legacy SHA-256 hashes
+"""
+
+import hashlib
+import hmac
+import os
+
+
+# scrypt cost parameters for new hashes (about 16MB and a few tens of ms per hash)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_BYTES = 16
+
+# Prefix of hashes stored as "scrypt$n$r$p$salt$hash" (salt and hash in hex)
+SCRYPT_PREFIX = "scrypt$"
+
+
+def hash_password(password):
+    """Hash a password with a random salt, for storing in account.json
+
+    This is deliberately slow, so call it off the Tk thread.
+    """
+    salt = os.urandom(SALT_BYTES)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+    return f"{SCRYPT_PREFIX}{SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password, stored_hash):
+    """Check a password against a stored hash
+
+    Accounts created before scrypt was introduced store an unsalted SHA-256 hex
+    digest, which is still accepted.
+    """
+    if not stored_hash:
+        return False
+
+    password_bytes = password.encode()
+    if stored_hash.startswith(SCRYPT_PREFIX):
+        try:
+            n, r, p, salt, digest = stored_hash[len(SCRYPT_PREFIX):].split("$")
+            expected = bytes.fromhex(digest)
+            actual = hashlib.scrypt(password_bytes, salt=bytes.fromhex(salt),
+                                    n=int(n), r=int(r), p=int(p), dklen=len(expected))
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    # Legacy unsalted SHA-256
+    return hmac.compare_digest(hashlib.sha256(password_bytes).hexdigest(), stored_hash)
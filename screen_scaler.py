@@ -4,8 +4,6 @@ Linux Gaming Center - Screen Scaling Utility
 Handles dynamic scaling of UI elements based on screen size
 """
 
-import tkinter as tk
-
 
 class ScreenScaler:
     """Handles dynamic scaling based on screen resolution"""
@@ -5,7 +5,6 @@ Handles loading and managing themes for the application
 """
 
 import json
-import os
 from pathlib import Path
 
 
@@ -18,6 +17,8 @@ class ThemeManager:
         self.themes_dir = self.app_root / "data" / "themes"
         self.current_theme = None
         self.theme_data = {}
+        # Resolved font tuples keyed by (font_key, default, scale), cleared when the theme changes
+        self._font_cache = {}
     
     def get_app_root(self):
         """Get the absolute path to the app root directory"""
@@ -42,6 +43,7 @@ class ThemeManager:
         try:
             with open(theme_file, 'r') as f:
                 self.theme_data = json.load(f)
+            self._font_cache.clear()
             
             self.current_theme = theme_name
             return self.theme_data
@@ -67,10 +69,27 @@ class ThemeManager:
     
     def get_color(self, color_key, default="#000000"):
         """Get a color value from the theme"""
-        return self.get(f"colors.{color_key}", default)
+        # Called for nearly every widget, so look the key up directly rather than
+        # building and splitting a dotted key for get()
+        colors = self.theme_data.get("colors")
+        if not isinstance(colors, dict):
+            return default
+        value = colors.get(color_key)
+        return value if value is not None else default
     
     def get_font(self, font_key, default=("Arial", 12), scaler=None):
-        """Get a font tuple from the theme, optionally scaled"""
+        """Get a font tuple from the theme, optionally scaled
+        
+        Widgets ask for the same few fonts over and over, so results are cached.
+        """
+        key = (font_key, default, scaler.scale if scaler else None)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._font_cache[key] = self._resolve_font(font_key, default, scaler)
+        return font
+    
+    def _resolve_font(self, font_key, default, scaler):
+        """Build a font tuple from the theme data"""
         font_data = self.get(f"fonts.{font_key}", None)
         if font_data:
             family = font_data.get("family", default[0])
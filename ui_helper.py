@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Linux Gaming Center - UI Helper Module
+Shared Tkinter/ttk helpers used across the library frames
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+
+# Shared ttk.Style for the application's Tk root
+_style = None
+
+# Colors the TCombobox style was last configured with
+_combobox_style_key = None
+
+# Colors and sizes the Treeview style was last configured with
+_treeview_style_key = None
+
+# Left click callbacks keyed by toplevel window path (see subscribe_click)
+_click_subscribers = {}
+
+# (subscriber list, callback) pairs keyed by the path of the widget that subscribed
+# them, so destroying the widget drops its callbacks
+_click_owners = {}
+
+
+def get_style():
+    """Get the shared ttk.Style instance"""
+    global _style
+    if _style is None:
+        _style = ttk.Style()
+    return _style
+
+
+def apply_combobox_style(theme):
+    """Apply the themed TCombobox style
+
+    ttk styles are global to the Tk interpreter, so once a frame has configured
+    them there is nothing to do until the theme colors change.
+    """
+    global _combobox_style_key
+
+    input_bg = theme.get_color("input_background", "#1A1A1A")
+    input_text = theme.get_color("input_text", "#FFFFFF")
+
+    key = (input_bg, input_text)
+    if key == _combobox_style_key:
+        return
+
+    style = get_style()
+    style.theme_use('clam')
+    style.configure('TCombobox',
+        fieldbackground=input_bg,
+        background=input_bg,
+        foreground=input_text,
+        borderwidth=1,
+        relief=tk.SOLID
+    )
+    style.map('TCombobox',
+        fieldbackground=[('readonly', input_bg)],
+        background=[('readonly', input_bg)],
+        foreground=[('readonly', input_text)]
+    )
+
+    _combobox_style_key = key
+
+
+def apply_treeview_style(theme, font, heading_font, row_height):
+    """Apply the themed Treeview style
+
+    Like apply_combobox_style, this only touches ttk when the colors or sizes change.
+    """
+    global _treeview_style_key
+
+    bg = theme.get_color("background_secondary", "#1A1A1A")
+    heading_bg = theme.get_color("menu_bar", "#2D2D2D")
+    text = theme.get_color("text_primary", "#FFFFFF")
+    selected = theme.get_color("primary", "#9D4EDD")
+
+    key = (bg, heading_bg, text, selected, font, heading_font, row_height)
+    if key == _treeview_style_key:
+        return
+
+    style = get_style()
+    style.theme_use('clam')
+    style.configure('Treeview',
+        background=bg,
+        fieldbackground=bg,
+        foreground=text,
+        font=font,
+        rowheight=row_height,
+        borderwidth=0
+    )
+    style.map('Treeview',
+        background=[('selected', selected)],
+        foreground=[('selected', text)]
+    )
+    style.configure('Treeview.Heading',
+        background=heading_bg,
+        foreground=text,
+        font=heading_font,
+        relief=tk.FLAT
+    )
+    style.map('Treeview.Heading',
+        background=[('active', heading_bg)]
+    )
+
+    _treeview_style_key = key
+
+
+def subscribe_click(widget, callback):
+    """Call callback for every left click in widget's toplevel window
+
+    The toplevel gets a single <Button-1> binding that fans out to every subscriber,
+    so frames add and remove plain Python callbacks instead of Tk bindings. The
+    callback is dropped when widget is destroyed, so it doesn't keep widget alive.
+    """
+    root = widget.winfo_toplevel()
+    key = str(root)
+    subscribers = _click_subscribers.get(key)
+    if subscribers is None:
+        subscribers = _click_subscribers[key] = []
+        root.bind("<Button-1>", lambda e: _dispatch_click(subscribers, e), add="+")
+        root.bind("<Destroy>", lambda e: e.widget is root and _click_subscribers.pop(key, None), add="+")
+    if callback in subscribers:
+        return
+    subscribers.append(callback)
+
+    # One <Destroy> binding per widget, however often it subscribes
+    owner = str(widget)
+    owned = _click_owners.get(owner)
+    if owned is None:
+        owned = _click_owners[owner] = []
+        widget.bind("<Destroy>", lambda e: e.widget is widget and _drop_click_owner(owner), add="+")
+    owned.append((subscribers, callback))
+
+
+def unsubscribe_click(widget, callback):
+    """Stop calling callback for left clicks in widget's toplevel window"""
+    subscribers = _click_subscribers.get(str(widget.winfo_toplevel()))
+    if subscribers and callback in subscribers:
+        subscribers.remove(callback)
+    owned = _click_owners.get(str(widget))
+    if owned and (subscribers, callback) in owned:
+        owned.remove((subscribers, callback))
+
+
+def _drop_click_owner(owner):
+    # The subscribing widget was destroyed - drop every callback it left subscribed
+    for subscribers, callback in _click_owners.pop(owner, ()):
+        if callback in subscribers:
+            subscribers.remove(callback)
+
+
+def _dispatch_click(subscribers, event):
+    # Iterate over a copy - callbacks may unsubscribe themselves
+    for callback in list(subscribers):
+        callback(event)
+
+
+class ContextMenu:
+    """Right-click menu for grid items, created once and refilled on each show"""
+
+    def __init__(self, parent, theme, scaler):
+        self.parent = parent
+        self.menu = tk.Menu(parent, tearoff=0)
+        self.menu.configure(
+            bg=theme.get_color("background_secondary", "#1A1A1A"),
+            fg=theme.get_color("text_primary", "#FFFFFF"),
+            activebackground=theme.get_color("primary", "#9D4EDD"),
+            activeforeground=theme.get_color("text_primary", "#FFFFFF"),
+            borderwidth=0,
+            font=theme.get_font("body_small", scaler=scaler)
+        )
+        self.just_opened = False
+        self.watching_clicks = False
+        self.menu.bind("<Unmap>", lambda e: self.release_outside_click())
+
+    def show(self, event, commands):
+        """Show the menu at the event position
+
+        commands is a list of (label, callback) pairs; None adds a separator.
+        """
+        menu = self.menu
+        menu.delete(0, tk.END)
+        for command in commands:
+            if command is None:
+                menu.add_separator()
+            else:
+                label, callback = command
+                menu.add_command(label=label, command=callback)
+
+        try:
+            self.parent.update_idletasks()
+
+            # Offset from the cursor so releasing the right button doesn't select the first item
+            menu.tk_popup(event.x_root + 10, event.y_root + 10)
+
+            # Ignore clicks for a moment so the menu doesn't close as soon as it opens
+            self.just_opened = True
+            self.parent.after(100, self.clear_just_opened)
+
+            # Close the menu on left clicks outside it (only after the initial delay)
+            self.parent.after(150, self.watch_outside_click)
+        except Exception as e:
+            print(f"Error showing context menu: {e}")
+            menu.unpost()
+
+    def clear_just_opened(self):
+        self.just_opened = False
+
+    def watch_outside_click(self):
+        """Start closing the menu on left clicks outside it"""
+        if self.watching_clicks or not self.menu.winfo_ismapped():
+            return
+        subscribe_click(self.parent, self.on_outside_click)
+        self.watching_clicks = True
+
+    def on_outside_click(self, event):
+        if self.just_opened or not self.menu.winfo_exists():
+            return
+
+        menu_x = self.menu.winfo_rootx()
+        menu_y = self.menu.winfo_rooty()
+        if (event.x_root < menu_x or event.x_root > menu_x + self.menu.winfo_width() or
+                event.y_root < menu_y or event.y_root > menu_y + self.menu.winfo_height()):
+            self.menu.unpost()
+            self.release_outside_click()
+
+    def release_outside_click(self):
+        """Stop watching for clicks outside the menu"""
+        if not self.watching_clicks:
+            return
+        try:
+            unsubscribe_click(self.parent, self.on_outside_click)
+        except tk.TclError:
+            pass
+        self.watching_clicks = False
@@ -5,18 +5,12 @@ Displays a welcome message for first-time users
 """
 
 import tkinter as tk
-from pathlib import Path
 import json
 
-# Try to import PIL for image handling
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-
 from theme_manager import get_app_root
 from path_helper import get_user_account_dir
+from image_cache import PIL_AVAILABLE, get_fitted_photo
+from json_helper import write_json
 
 
 class WelcomePopup:
@@ -100,8 +94,9 @@ class WelcomePopup:
             "Visit the store for plugins and apps"
         ]
         
+        bullet_padding = (0, self.scaler.scale_padding(10))
         for point in bullet_points:
-            bullet_label = tk.Label(
+            tk.Label(
                 left_frame,
                 text=f"• {point}",
                 font=body_font,
@@ -109,8 +104,7 @@ class WelcomePopup:
                 fg=text_secondary,
                 anchor="w",
                 justify=tk.LEFT
-            )
-            bullet_label.pack(anchor="w", pady=(0, self.scaler.scale_padding(10)))
+            ).pack(anchor="w", pady=bullet_padding)
         
         # Right side - Logo image
         right_frame = tk.Frame(content_frame, bg=bg_color)
@@ -120,23 +114,24 @@ class WelcomePopup:
         logo_path = app_root / "data" / "themes" / "cosmic-twilight" / "images" / "linuxgamingcenterdialogue.png"
         
         if logo_path.exists() and PIL_AVAILABLE:
-            try:
-                logo_image = Image.open(logo_path)
-                # Resize logo to fit nicely (keeping aspect ratio, scaled - larger for bigger popup)
-                max_width = self.scaler.scale_dimension(400)
-                max_height = self.scaler.scale_dimension(400)
-                logo_image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-                logo_photo = ImageTk.PhotoImage(logo_image)
-                
-                logo_label = tk.Label(
-                    right_frame,
-                    image=logo_photo,
-                    bg=bg_color
-                )
-                logo_label.image = logo_photo  # Keep reference
-                logo_label.pack(anchor=tk.CENTER)
-            except Exception as e:
-                print(f"Error loading welcome logo: {e}")
+            logo_label = tk.Label(right_frame, bg=bg_color)
+            logo_label.pack(anchor=tk.CENTER)
+            
+            # Load the logo once the popup has been drawn
+            def load_logo():
+                if not logo_label.winfo_exists():
+                    return
+                try:
+                    # Resize logo to fit nicely (keeping aspect ratio, scaled - larger for bigger popup)
+                    max_width = self.scaler.scale_dimension(400)
+                    max_height = self.scaler.scale_dimension(400)
+                    logo_photo = get_fitted_photo(logo_path, max_width, max_height)
+                    logo_label.configure(image=logo_photo)
+                    logo_label.image = logo_photo  # Keep reference
+                except Exception as e:
+                    print(f"Error loading welcome logo: {e}")
+            
+            logo_label.after_idle(load_logo)
         
         # Checkbox frame
         checkbox_frame = tk.Frame(self.popup, bg=bg_color)
@@ -197,8 +192,7 @@ class WelcomePopup:
                         
                         account_data['show_welcome_popup'] = False
                         
-                        with open(account_file, 'w') as f:
-                            json.dump(account_data, f, indent=2)
+                        write_json(account_file, account_data)
                     except Exception as e:
                         print(f"Error saving welcome preference: {e}")
             